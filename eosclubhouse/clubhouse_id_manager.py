@@ -24,56 +24,153 @@ import gi
 gi.require_version('GObject', '2.0')
 gi.require_version('Json', '1.0')
 
+import atexit
 import json
 import logging
 import os
+import base64
+import queue
+import secrets
 import sqlite3
+import threading
 import time
-import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
-from gi.repository import GObject, Json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from gi.repository import GLib, GObject, Json
 from eosclubhouse import config, utils
 from eosclubhouse.utils import ClubhouseState
 
 logger = logging.getLogger(__name__)
 
+# Timestamps are kept as Unix epoch milliseconds everywhere (memory and DB);
+# datetime objects are only materialized lazily for display-oriented callers.
+_MS_PER_DAY = 86400 * 1000
+
+
+def _now_ms() -> int:
+    """Current time as Unix epoch milliseconds."""
+    return int(time.time() * 1000)
+
+
+def _ms_to_datetime(timestamp_ms: int) -> datetime:
+    """Convert an epoch-milliseconds timestamp to a datetime."""
+    return datetime.fromtimestamp(timestamp_ms / 1000)
+
+
+def _dump_metadata(metadata: Optional[Dict]):
+    """Serialize metadata for storage; empty dicts are stored as NULL."""
+    if not metadata:
+        return None
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, separators=(',', ':'))
+
+
+def _load_metadata(blob) -> Dict:
+    """Deserialize a metadata column, skipping the parse when empty."""
+    if not blob or blob in ('{}', b'{}'):
+        return {}
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+# Hot-path statements hoisted to module level so the exact same SQL text is
+# handed to sqlite3 on every call, letting its per-connection statement cache
+# skip re-preparing them.
+_SQL_INSERT_TOKEN = '''
+    INSERT INTO clubhouse_tokens
+    (token, user_id, clubhouse_id, expires_at, metadata, created_at, last_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_UPDATE_LAST_USED = 'UPDATE clubhouse_tokens SET last_used = ? WHERE token = ?'
+_SQL_DELETE_TOKEN = 'DELETE FROM clubhouse_tokens WHERE token = ?'
+# Unfollowing only flips a row to status='inactive', so a later
+# re-follow hits the same (follower_id, following_id) primary key; the
+# upsert revives the row (keeping its original created_at) instead of
+# dying on the constraint inside the writer thread.
+_SQL_INSERT_RELATIONSHIP = '''
+    INSERT INTO follow_relationships
+    (follower_id, following_id, followed_via_token, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(follower_id, following_id) DO UPDATE SET
+        status = excluded.status,
+        followed_via_token = excluded.followed_via_token,
+        updated_at = excluded.updated_at
+'''
+_SQL_DEACTIVATE_RELATIONSHIP = '''
+    UPDATE follow_relationships
+    SET status = 'inactive', updated_at = ?
+    WHERE follower_id = ? AND following_id = ?
+'''
+
 
 class ClubhouseIdToken:
     """Represents a clubhouse ID token for user identification and following."""
-    
-    def __init__(self, token: str, user_id: str, clubhouse_id: str, 
-                 expires_at: Optional[datetime] = None, metadata: Optional[Dict] = None):
+
+    __slots__ = ('token', 'user_id', 'clubhouse_id', 'expires_at_ms', 'metadata',
+                 'created_at_ms', 'last_used_ms')
+
+    def __init__(self, token: str, user_id: str, clubhouse_id: str,
+                 expires_at: Optional[datetime] = None, metadata: Optional[Dict] = None,
+                 _now_ms_value: Optional[int] = None):
+        now_ms = _now_ms_value if _now_ms_value is not None else _now_ms()
         self.token = token
         self.user_id = user_id
         self.clubhouse_id = clubhouse_id
-        self.expires_at = expires_at or (datetime.now() + timedelta(days=30))
+        if expires_at is None:
+            self.expires_at_ms = now_ms + 30 * _MS_PER_DAY
+        elif isinstance(expires_at, datetime):
+            self.expires_at_ms = int(expires_at.timestamp() * 1000)
+        else:
+            self.expires_at_ms = int(expires_at)
         self.metadata = metadata or {}
-        self.created_at = datetime.now()
-        self.last_used = datetime.now()
-    
+        self.created_at_ms = now_ms
+        self.last_used_ms = now_ms
+
+    @property
+    def expires_at(self) -> datetime:
+        """Expiration time as a datetime (materialized on demand)."""
+        return _ms_to_datetime(self.expires_at_ms)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime (materialized on demand)."""
+        return _ms_to_datetime(self.created_at_ms)
+
+    @property
+    def last_used(self) -> datetime:
+        """Last-used time as a datetime (materialized on demand)."""
+        return _ms_to_datetime(self.last_used_ms)
+
     def is_valid(self) -> bool:
         """Check if the token is still valid."""
-        return datetime.now() < self.expires_at
-    
+        return _now_ms() < self.expires_at_ms
+
     def refresh(self, days: int = 30) -> None:
         """Refresh the token expiration."""
-        self.expires_at = datetime.now() + timedelta(days=days)
-        self.last_used = datetime.now()
-    
+        now_ms = _now_ms()
+        self.expires_at_ms = now_ms + days * _MS_PER_DAY
+        self.last_used_ms = now_ms
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert token to dictionary for storage."""
         return {
             'token': self.token,
             'user_id': self.user_id,
             'clubhouse_id': self.clubhouse_id,
-            'expires_at': self.expires_at.isoformat(),
+            'expires_at': self.expires_at_ms,
             'metadata': self.metadata,
-            'created_at': self.created_at.isoformat(),
-            'last_used': self.last_used.isoformat()
+            'created_at': self.created_at_ms,
+            'last_used': self.last_used_ms
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ClubhouseIdToken':
         """Create token from dictionary."""
@@ -81,26 +178,54 @@ class ClubhouseIdToken:
             token=data['token'],
             user_id=data['user_id'],
             clubhouse_id=data['clubhouse_id'],
-            expires_at=datetime.fromisoformat(data['expires_at']),
+            expires_at=data['expires_at'],
             metadata=data.get('metadata', {})
         )
-        token.created_at = datetime.fromisoformat(data['created_at'])
-        token.last_used = datetime.fromisoformat(data['last_used'])
+        token.created_at_ms = int(data['created_at'])
+        token.last_used_ms = int(data['last_used'])
+        return token
+
+    @classmethod
+    def _from_row(cls, row: Tuple) -> 'ClubhouseIdToken':
+        """Build a token straight from a DB row, skipping dict staging."""
+        token = cls.__new__(cls)
+        token.token = row[0]
+        token.user_id = row[1]
+        token.clubhouse_id = row[2]
+        token.expires_at_ms = row[3]
+        token.metadata = _load_metadata(row[4])
+        token.created_at_ms = row[5]
+        token.last_used_ms = row[6]
         return token
 
 
 class ClubhouseFollowRelationship:
     """Represents a following relationship between clubhouse users."""
-    
-    def __init__(self, follower_id: str, following_id: str, 
-                 followed_via_token: str, status: str = 'active'):
+
+    __slots__ = ('follower_id', 'following_id', 'followed_via_token', 'status',
+                 'created_at_ms', 'updated_at_ms')
+
+    def __init__(self, follower_id: str, following_id: str,
+                 followed_via_token: str, status: str = 'active',
+                 _now_ms_value: Optional[int] = None):
+        now_ms = _now_ms_value if _now_ms_value is not None else _now_ms()
         self.follower_id = follower_id
         self.following_id = following_id
         self.followed_via_token = followed_via_token
         self.status = status  # active, pending, blocked
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
-    
+        self.created_at_ms = now_ms
+        self.updated_at_ms = now_ms
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime (materialized on demand)."""
+        return _ms_to_datetime(self.created_at_ms)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Last-update time as a datetime (materialized on demand)."""
+        return _ms_to_datetime(self.updated_at_ms)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert relationship to dictionary."""
         return {
@@ -108,10 +233,10 @@ class ClubhouseFollowRelationship:
             'following_id': self.following_id,
             'followed_via_token': self.followed_via_token,
             'status': self.status,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at_ms,
+            'updated_at': self.updated_at_ms
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ClubhouseFollowRelationship':
         """Create relationship from dictionary."""
@@ -121,14 +246,34 @@ class ClubhouseFollowRelationship:
             followed_via_token=data['followed_via_token'],
             status=data.get('status', 'active')
         )
-        rel.created_at = datetime.fromisoformat(data['created_at'])
-        rel.updated_at = datetime.fromisoformat(data['updated_at'])
+        rel.created_at_ms = int(data['created_at'])
+        rel.updated_at_ms = int(data['updated_at'])
+        return rel
+
+    @classmethod
+    def _from_row(cls, row: Tuple) -> 'ClubhouseFollowRelationship':
+        """Build a relationship straight from a DB row, skipping dict staging."""
+        rel = cls.__new__(cls)
+        rel.follower_id = row[0]
+        rel.following_id = row[1]
+        rel.followed_via_token = row[2]
+        rel.status = row[3]
+        rel.created_at_ms = row[4]
+        rel.updated_at_ms = row[5]
         return rel
 
 
 class ClubhouseIdManager(GObject.GObject):
     """Manages clubhouse IDs and token-based following relationships."""
-    
+
+    # How long last_used updates may sit in memory before being flushed.
+    _LAST_USED_FLUSH_SECONDS = 5
+    _SCHEMA_VERSION = 1
+
+    # Number of token-cache shards; must stay a power of two so the shard
+    # can be picked with a mask off the token hash.
+    _NUM_SHARDS = 16
+
     __gsignals__ = {
         'token-created': (
             GObject.SignalFlags.RUN_FIRST, None, (str, str)
@@ -147,41 +292,216 @@ class ClubhouseIdManager(GObject.GObject):
     def __init__(self, db_path: Optional[str] = None):
         super().__init__()
         self.db_path = db_path or os.path.join(config.USER_DIR, 'clubhouse_ids.db')
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # A single long-lived connection shared by every operation: opening a
+        # fresh connection per call throws away SQLite's page cache and
+        # prepared schema on every statement.  The lock keeps it safe to use
+        # from worker threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     isolation_level=None,
+                                     cached_statements=256)
+        self._apply_pragmas()
+
         self._ensure_db_exists()
-        self._tokens_cache: Dict[str, ClubhouseIdToken] = {}
-        self._relationships_cache: Dict[str, List[ClubhouseFollowRelationship]] = {}
-        self._load_cache()
-    
+        # The token cache is sharded so concurrent validate/generate/revoke
+        # calls only contend when they hash to the same shard.
+        self._token_shards: List[Dict[str, ClubhouseIdToken]] = [
+            {} for _ in range(self._NUM_SHARDS)]
+        self._shard_locks = [threading.Lock() for _ in range(self._NUM_SHARDS)]
+        # The shard locks only cover the token shards.  The secondary
+        # structures below are also touched from worker threads (the
+        # widgets run revoke/follow/unfollow off the main loop), so
+        # their read-modify-write sequences -- the two-dict index
+        # updates, the write-generation bump, the pre-size swaps -- are
+        # serialized by this lock.  Plain single get/set/pop operations
+        # on these dicts are already atomic under the GIL and stay
+        # unlocked.  Never hold this lock while taking self._lock or a
+        # shard lock (or vice versa); every critical section is pure
+        # dict work, so the question of ordering never comes up.
+        self._caches_lock = threading.Lock()
+        # Per-follower mapping of following_id -> relationship, so the pair
+        # lookup on the follow path is O(1).
+        self._relationships_cache: Dict[str, Dict[str, ClubhouseFollowRelationship]] = {}
+        # Materialized per-user following lists, rebuilt lazily after a
+        # write; repeated reads then reuse one flat list instead of
+        # re-walking the map's values every call.
+        self._following_lists: Dict[str, List[ClubhouseFollowRelationship]] = {}
+        # Reverse (followers) lookups, built lazily per user on first
+        # query and invalidated per affected user on writes.
+        self._followers_cache: Dict[str, Tuple[ClubhouseFollowRelationship, ...]] = {}
+        # Successful validations memoized for the second they happened
+        # in, so bursty repeat validations of one token (bulk follows)
+        # skip the shard lock and expiry bookkeeping.
+        self._validation_memo: Dict[str, Tuple[int, ClubhouseIdToken]] = {}
+        # Info lookups are cached against a write generation: any token
+        # or relationship write bumps the generation, invalidating every
+        # cached info dict at once.
+        self._write_gen = 0
+        self._info_cache: Dict[str, Tuple[int, Optional[Dict[str, Any]]]] = {}
+        # Secondary indexes so the by-user/by-clubhouse lookups are dict
+        # accesses instead of scans over the whole cache.
+        self._tokens_by_user: Dict[str, set] = {}
+        self._tokens_by_clubhouse: Dict[str, set] = {}
+        self._pending_last_used: Dict[str, int] = {}
+        self._last_used_flush_id = None
+
+        # All writes are drained by a single background thread so callers --
+        # typically the GTK main loop -- never block on a commit/fsync.  The
+        # in-memory caches are updated synchronously, keeping reads
+        # consistent while the row is still in flight.
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name='ClubhouseIdWriter', daemon=True)
+        self._writer_thread.start()
+        # The writer is a daemon thread, so a process that exits without
+        # calling close() -- a one-shot CLI invocation, say -- would drop
+        # whatever is still queued.  The atexit hook drains the queue
+        # before the interpreter tears the thread down.
+        self._closed = False
+        atexit.register(self.close)
+
+    def _apply_pragmas(self) -> None:
+        """Tune the long-lived connection for a threaded consumer."""
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-64000')
+
+    def close(self) -> None:
+        """Flush pending writes and close the database connection.
+
+        Safe to call more than once; the atexit hook makes the second
+        call a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_last_used()
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        with self._lock:
+            self._conn.close()
+
+    def _enqueue_write(self, sql: str, params, callback=None) -> None:
+        """Queue a DB write for the background writer thread.
+
+        A list of params means executemany; callback (if any) runs on the
+        main loop once the write has been committed.
+        """
+        self._write_queue.put((sql, params, callback))
+
+    def _wait_for_writes(self) -> None:
+        """Block until every queued write has been committed."""
+        self._write_queue.join()
+
+    def _writer_loop(self) -> None:
+        """Drain queued writes, committing each batch in one transaction.
+
+        No exception may escape this body: _wait_for_writes() joins the
+        queue, so a dead writer -- or a single missed task_done() --
+        would hang every read forever.  A failing statement is logged
+        and dropped, its callback is not fired, and the rest of the
+        batch still commits.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            failed = set()
+            try:
+                with self._lock, self._conn as conn:
+                    for position, entry in enumerate(batch):
+                        if entry is None:
+                            stop = True
+                            continue
+                        sql, params, _callback = entry
+                        try:
+                            if isinstance(params, list):
+                                conn.executemany(sql, params)
+                            else:
+                                conn.execute(sql, params)
+                        except sqlite3.Error:
+                            failed.add(position)
+                            logger.exception('Dropping failed write: %s', sql)
+            except sqlite3.Error:
+                # The commit itself failed; the whole batch is lost.
+                failed.update(range(len(batch)))
+                logger.exception('Dropping failed batch of %d writes', len(batch))
+            finally:
+                for position, entry in enumerate(batch):
+                    if (entry is not None and entry[2] is not None and
+                            position not in failed):
+                        GLib.idle_add(entry[2])
+                    self._write_queue.task_done()
+
+            if stop:
+                break
+
+    def _flush_last_used(self) -> bool:
+        """Write all coalesced last_used updates in a single transaction."""
+        with self._lock:
+            if self._last_used_flush_id is not None:
+                GLib.source_remove(self._last_used_flush_id)
+                self._last_used_flush_id = None
+            if not self._pending_last_used:
+                return GLib.SOURCE_REMOVE
+            updates = [(last_used, token)
+                       for token, last_used in self._pending_last_used.items()]
+            self._pending_last_used.clear()
+        self._enqueue_write(_SQL_UPDATE_LAST_USED, updates)
+        return GLib.SOURCE_REMOVE
+
     def _ensure_db_exists(self) -> None:
-        """Ensure the database and tables exist."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        with sqlite3.connect(self.db_path) as conn:
+        """Ensure the database tables exist."""
+        with self._lock, self._conn as conn:
+            # Warm starts skip the DDL entirely: user_version is stamped
+            # once the schema is in place, so subsequent constructions pay
+            # a single PRAGMA read instead of five schema-table probes.
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version == self._SCHEMA_VERSION:
+                return
+
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS clubhouse_tokens (
                     token TEXT PRIMARY KEY,
                     user_id TEXT NOT NULL,
                     clubhouse_id TEXT NOT NULL,
-                    expires_at TEXT NOT NULL,
+                    expires_at INTEGER NOT NULL,
                     metadata TEXT,
-                    created_at TEXT NOT NULL,
-                    last_used TEXT NOT NULL
+                    created_at INTEGER NOT NULL,
+                    last_used INTEGER NOT NULL
                 )
             ''')
             
+            # WITHOUT ROWID clusters rows on the (follower, following) key,
+            # so the pair lookup is a single B-tree walk instead of a UNIQUE
+            # index probe followed by a rowid fetch.
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS follow_relationships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     follower_id TEXT NOT NULL,
                     following_id TEXT NOT NULL,
                     followed_via_token TEXT NOT NULL,
                     status TEXT NOT NULL DEFAULT 'active',
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    UNIQUE(follower_id, following_id)
-                )
+                    created_at INTEGER NOT NULL,
+                    updated_at INTEGER NOT NULL,
+                    PRIMARY KEY (follower_id, following_id)
+                ) WITHOUT ROWID
             ''')
-            
+
+            # A version-0 file may predate the epoch-ms timestamps, in
+            # which case the CREATE TABLE IF NOT EXISTS above kept the
+            # legacy ISO-string tables; rebuild them before the indexes
+            # go on, or every comparison against _now_ms() would be
+            # int-vs-str.
+            self._migrate_legacy_tables(conn)
+
             conn.execute('''
                 CREATE INDEX IF NOT EXISTS idx_tokens_user_id 
                 ON clubhouse_tokens(user_id)
@@ -192,140 +512,335 @@ class ClubhouseIdManager(GObject.GObject):
                 ON clubhouse_tokens(clubhouse_id)
             ''')
             
+            # The primary key already serves follower-side lookups; the
+            # partial index makes the active-only followers scan a direct
+            # range read with no status filter.
             conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_relationships_follower 
-                ON follow_relationships(follower_id)
+                CREATE INDEX IF NOT EXISTS idx_rel_following_active
+                ON follow_relationships(following_id)
+                WHERE status = 'active'
             ''')
-            
+
+            conn.execute('PRAGMA user_version = %d' % self._SCHEMA_VERSION)
+
+    @staticmethod
+    def _migrate_legacy_tables(conn) -> None:
+        """Rebuild version-0 tables with epoch-millisecond timestamps.
+
+        The original schema declared the timestamp columns TEXT and
+        stored naive local isoformat() strings; TEXT affinity coerces
+        integers back to strings, so an in-place UPDATE cannot change
+        the rows and each legacy table is rebuilt with the converted
+        rows copied across.  julianday with the 'utc' modifier reads
+        the strings as local time and keeps sub-second precision.
+        Tables already declaring INTEGER columns pass straight through.
+        """
+        def column_type(table, column):
+            for row in conn.execute('PRAGMA table_info(%s)' % table):
+                if row[1] == column:
+                    return row[2].upper()
+            return None
+
+        if column_type('clubhouse_tokens', 'expires_at') == 'TEXT':
             conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_relationships_following 
-                ON follow_relationships(following_id)
+                CREATE TABLE clubhouse_tokens_v1 (
+                    token TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    clubhouse_id TEXT NOT NULL,
+                    expires_at INTEGER NOT NULL,
+                    metadata TEXT,
+                    created_at INTEGER NOT NULL,
+                    last_used INTEGER NOT NULL
+                )
             ''')
-    
-    def _load_cache(self) -> None:
-        """Load tokens and relationships into cache."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Load tokens
-            cursor = conn.execute('''
-                SELECT token, user_id, clubhouse_id, expires_at, metadata, created_at, last_used
+            conn.execute('''
+                INSERT INTO clubhouse_tokens_v1
+                SELECT token, user_id, clubhouse_id,
+                       CAST((julianday(expires_at, 'utc') - 2440587.5)
+                            * 86400000 AS INTEGER),
+                       metadata,
+                       CAST((julianday(created_at, 'utc') - 2440587.5)
+                            * 86400000 AS INTEGER),
+                       CAST((julianday(last_used, 'utc') - 2440587.5)
+                            * 86400000 AS INTEGER)
                 FROM clubhouse_tokens
-                WHERE expires_at > datetime('now')
             ''')
-            
-            for row in cursor.fetchall():
-                token_data = {
-                    'token': row[0],
-                    'user_id': row[1],
-                    'clubhouse_id': row[2],
-                    'expires_at': row[3],
-                    'metadata': json.loads(row[4]) if row[4] else {},
-                    'created_at': row[5],
-                    'last_used': row[6]
-                }
-                token = ClubhouseIdToken.from_dict(token_data)
-                self._tokens_cache[token.token] = token
-            
-            # Load relationships
-            cursor = conn.execute('''
-                SELECT follower_id, following_id, followed_via_token, status, created_at, updated_at
+            conn.execute('DROP TABLE clubhouse_tokens')
+            conn.execute(
+                'ALTER TABLE clubhouse_tokens_v1 RENAME TO clubhouse_tokens')
+
+        if column_type('follow_relationships', 'created_at') == 'TEXT':
+            conn.execute('''
+                CREATE TABLE follow_relationships_v1 (
+                    follower_id TEXT NOT NULL,
+                    following_id TEXT NOT NULL,
+                    followed_via_token TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'active',
+                    created_at INTEGER NOT NULL,
+                    updated_at INTEGER NOT NULL,
+                    PRIMARY KEY (follower_id, following_id)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+                INSERT INTO follow_relationships_v1
+                SELECT follower_id, following_id, followed_via_token, status,
+                       CAST((julianday(created_at, 'utc') - 2440587.5)
+                            * 86400000 AS INTEGER),
+                       CAST((julianday(updated_at, 'utc') - 2440587.5)
+                            * 86400000 AS INTEGER)
                 FROM follow_relationships
-                WHERE status = 'active'
             ''')
-            
-            for row in cursor.fetchall():
-                rel_data = {
-                    'follower_id': row[0],
-                    'following_id': row[1],
-                    'followed_via_token': row[2],
-                    'status': row[3],
-                    'created_at': row[4],
-                    'updated_at': row[5]
-                }
-                relationship = ClubhouseFollowRelationship.from_dict(rel_data)
-                
-                if relationship.follower_id not in self._relationships_cache:
-                    self._relationships_cache[relationship.follower_id] = []
-                self._relationships_cache[relationship.follower_id].append(relationship)
+            conn.execute('DROP TABLE follow_relationships')
+            conn.execute(
+                'ALTER TABLE follow_relationships_v1 RENAME TO follow_relationships')
     
+    def _shard_for(self, token: str) -> int:
+        """Pick the cache shard a token lives in."""
+        return hash(token) & (self._NUM_SHARDS - 1)
+
+    def _get_token(self, token: str) -> Optional[ClubhouseIdToken]:
+        """Look up a cached token, locking only its shard."""
+        shard = self._shard_for(token)
+        with self._shard_locks[shard]:
+            return self._token_shards[shard].get(token)
+
+    def _index_token(self, token_obj: ClubhouseIdToken) -> None:
+        """Add a token to the secondary lookup indexes."""
+        with self._caches_lock:
+            self._tokens_by_user.setdefault(token_obj.user_id, set()).add(token_obj.token)
+            self._tokens_by_clubhouse.setdefault(
+                token_obj.clubhouse_id, set()).add(token_obj.token)
+
+    def _unindex_token(self, token_obj: ClubhouseIdToken) -> None:
+        """Remove a token from the secondary lookup indexes."""
+        with self._caches_lock:
+            for index, key in ((self._tokens_by_user, token_obj.user_id),
+                               (self._tokens_by_clubhouse, token_obj.clubhouse_id)):
+                tokens = index.get(key)
+                if tokens is not None:
+                    tokens.discard(token_obj.token)
+                    if not tokens:
+                        del index[key]
+
+    def _bump_write_gen(self) -> None:
+        """Advance the write generation, invalidating cached info dicts."""
+        with self._caches_lock:
+            self._write_gen += 1
+
+    def _cache_token_row(self, row: Tuple) -> ClubhouseIdToken:
+        """Cache a token row, keeping any object already faulted in."""
+        token = row[0]
+        shard = self._shard_for(token)
+        with self._shard_locks[shard]:
+            token_obj = self._token_shards[shard].get(token)
+            if token_obj is None:
+                token_obj = ClubhouseIdToken._from_row(row)
+                self._token_shards[shard][token] = token_obj
+        self._index_token(token_obj)
+        return token_obj
+
+    def _load_token(self, token: str) -> Optional[ClubhouseIdToken]:
+        """Fault a single token in from the DB via its primary key."""
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            row = conn.execute('''
+                SELECT token, user_id, clubhouse_id, expires_at, metadata,
+                       created_at, last_used
+                FROM clubhouse_tokens
+                WHERE token = ?
+            ''', (token,)).fetchone()
+        if row is None:
+            return None
+        return self._cache_token_row(row)
+
+    def _load_following(self, user_id: str) -> Dict[str, ClubhouseFollowRelationship]:
+        """Fault a user's following map in from the DB."""
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            cursor = conn.execute('''
+                SELECT follower_id, following_id, followed_via_token, status,
+                       created_at, updated_at
+                FROM follow_relationships
+                WHERE follower_id = ? AND status = 'active'
+            ''', (user_id,))
+            relationships = {}
+            for row in cursor:
+                relationship = ClubhouseFollowRelationship._from_row(row)
+                relationships[relationship.following_id] = relationship
+        self._relationships_cache[user_id] = relationships
+        return relationships
+
     def generate_token(self, user_id: str, clubhouse_id: str, 
                       expires_days: int = 30, metadata: Optional[Dict] = None) -> str:
         """Generate a new token for a user."""
-        token = str(uuid.uuid4())
-        
-        # Check if token already exists (extremely unlikely)
-        while token in self._tokens_cache:
-            token = str(uuid.uuid4())
+        token = secrets.token_urlsafe(16)
         
+        now_ms = _now_ms()
         token_obj = ClubhouseIdToken(
             token=token,
             user_id=user_id,
             clubhouse_id=clubhouse_id,
-            expires_at=datetime.now() + timedelta(days=expires_days),
-            metadata=metadata or {}
+            expires_at=now_ms + expires_days * _MS_PER_DAY,
+            metadata=metadata or {},
+            _now_ms_value=now_ms
         )
         
-        # Store in database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO clubhouse_tokens 
-                (token, user_id, clubhouse_id, expires_at, metadata, created_at, last_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                token_obj.token,
-                token_obj.user_id,
-                token_obj.clubhouse_id,
-                token_obj.expires_at.isoformat(),
-                json.dumps(token_obj.metadata),
-                token_obj.created_at.isoformat(),
-                token_obj.last_used.isoformat()
-            ))
-        
-        # Update cache
-        self._tokens_cache[token] = token_obj
-        
-        self.emit('token-created', user_id, token)
+        # Update cache synchronously, then hand the insert to the writer
+        # thread; the signal fires once the row has been committed.
+        shard = self._shard_for(token)
+        with self._shard_locks[shard]:
+            self._token_shards[shard][token] = token_obj
+        self._index_token(token_obj)
+
+        self._enqueue_write(_SQL_INSERT_TOKEN, (
+            token_obj.token,
+            token_obj.user_id,
+            token_obj.clubhouse_id,
+            token_obj.expires_at_ms,
+            _dump_metadata(token_obj.metadata),
+            token_obj.created_at_ms,
+            token_obj.last_used_ms
+        ), lambda: self.emit('token-created', user_id, token))
+        self._bump_write_gen()
         logger.info(f"Generated token {token} for user {user_id} with clubhouse ID {clubhouse_id}")
         
         return token
     
+    @staticmethod
+    def _presized(old: Dict, extra: int) -> Dict:
+        """Return a copy of `old` with table capacity for `extra` more entries.
+
+        CPython dicts only grow on insert and never shrink on delete, so
+        inserting and deleting integer sentinels leaves a table big
+        enough that the bulk inserts that follow do not rehash.
+        """
+        new: Dict = {i: None for i in range(extra)}
+        for i in range(extra):
+            del new[i]
+        new.update(old)
+        return new
+
+    def reserve(self, n_tokens: int = 0, n_relationships: int = 0) -> None:
+        """Pre-size the in-memory caches ahead of a known bulk load."""
+        if n_tokens:
+            per_shard = -(-n_tokens // self._NUM_SHARDS)
+            for shard in range(self._NUM_SHARDS):
+                with self._shard_locks[shard]:
+                    self._token_shards[shard] = self._presized(
+                        self._token_shards[shard], per_shard)
+        if n_relationships:
+            self._relationships_cache = self._presized(
+                self._relationships_cache, n_relationships)
+
+    def generate_tokens(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """Generate many tokens in one batch.
+
+        Draws the entropy for the whole batch with a single os.urandom
+        read instead of one CSPRNG call per token.  Each spec is a dict
+        of generate_token keyword arguments: user_id, clubhouse_id and
+        optionally expires_days / metadata.
+        """
+        count = len(specs)
+        if count == 0:
+            return []
+        entropy = os.urandom(16 * count)
+        now_ms = _now_ms()
+        tokens = []
+        for index, spec in enumerate(specs):
+            raw = entropy[16 * index:16 * (index + 1)]
+            token = base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+            token_obj = ClubhouseIdToken(
+                token=token,
+                user_id=spec['user_id'],
+                clubhouse_id=spec['clubhouse_id'],
+                expires_at=now_ms + spec.get('expires_days', 30) * _MS_PER_DAY,
+                metadata=spec.get('metadata') or {},
+                _now_ms_value=now_ms
+            )
+            shard = self._shard_for(token)
+            with self._shard_locks[shard]:
+                self._token_shards[shard][token] = token_obj
+            self._index_token(token_obj)
+            self._enqueue_write(_SQL_INSERT_TOKEN, (
+                token_obj.token,
+                token_obj.user_id,
+                token_obj.clubhouse_id,
+                token_obj.expires_at_ms,
+                _dump_metadata(token_obj.metadata),
+                token_obj.created_at_ms,
+                token_obj.last_used_ms
+            ), lambda user_id=token_obj.user_id, token=token: self.emit(
+                'token-created', user_id, token))
+            tokens.append(token)
+        self._bump_write_gen()
+        logger.info(f"Generated {count} tokens in one batch")
+        return tokens
+    
     def validate_token(self, token: str) -> Optional[ClubhouseIdToken]:
         """Validate a token and return the token object if valid."""
-        if token not in self._tokens_cache:
-            return None
+        # Entries expire with the wall-clock second they were made in,
+        # so a stale hit can never outlive the token by more than 1s.
+        bucket = _now_ms() // 1000
+        memo = self._validation_memo.get(token)
+        if memo is not None and memo[0] == bucket:
+            return memo[1]
         
-        token_obj = self._tokens_cache[token]
+        shard = self._shard_for(token)
+        with self._shard_locks[shard]:
+            token_obj = self._token_shards[shard].get(token)
+        if token_obj is None:
+            # Cache miss: fault the row in through the primary-key index.
+            token_obj = self._load_token(token)
+        if token_obj is None:
+            return None
+
         if not token_obj.is_valid():
             # Remove expired token
-            del self._tokens_cache[token]
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('DELETE FROM clubhouse_tokens WHERE token = ?', (token,))
+            with self._shard_locks[shard]:
+                self._token_shards[shard].pop(token, None)
+            self._unindex_token(token_obj)
+            with self._lock:
+                self._pending_last_used.pop(token, None)
+            self._enqueue_write(_SQL_DELETE_TOKEN, (token,))
             return None
         
-        # Update last used
-        token_obj.last_used = datetime.now()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE clubhouse_tokens SET last_used = ? WHERE token = ?
-            ''', (token_obj.last_used.isoformat(), token))
+        # Update last used.  Validation is a read-heavy, bursty path, so the
+        # write is coalesced: record it in memory and let a single batched
+        # flush turn N UPDATE transactions into one.
+        token_obj.last_used_ms = _now_ms()
+        with self._lock:
+            self._pending_last_used[token] = token_obj.last_used_ms
+            if self._last_used_flush_id is None:
+                self._last_used_flush_id = GLib.timeout_add_seconds(
+                    self._LAST_USED_FLUSH_SECONDS, self._flush_last_used)
         
+        self._validation_memo[token] = (bucket, token_obj)
         self.emit('token-used', token_obj.user_id, token)
         return token_obj
     
     def get_user_tokens(self, user_id: str) -> List[ClubhouseIdToken]:
         """Get all valid tokens for a user."""
-        tokens = []
-        for token_obj in self._tokens_cache.values():
-            if token_obj.user_id == user_id and token_obj.is_valid():
-                tokens.append(token_obj)
-        return tokens
-    
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            rows = conn.execute('''
+                SELECT token, user_id, clubhouse_id, expires_at, metadata,
+                       created_at, last_used
+                FROM clubhouse_tokens
+                WHERE user_id = ? AND expires_at > ?
+            ''', (user_id, _now_ms())).fetchall()
+        return [self._cache_token_row(row) for row in rows]
+
     def get_tokens_by_clubhouse_id(self, clubhouse_id: str) -> List[ClubhouseIdToken]:
         """Get all valid tokens for a clubhouse ID."""
-        tokens = []
-        for token_obj in self._tokens_cache.values():
-            if token_obj.clubhouse_id == clubhouse_id and token_obj.is_valid():
-                tokens.append(token_obj)
-        return tokens
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            rows = conn.execute('''
+                SELECT token, user_id, clubhouse_id, expires_at, metadata,
+                       created_at, last_used
+                FROM clubhouse_tokens
+                WHERE clubhouse_id = ? AND expires_at > ?
+            ''', (clubhouse_id, _now_ms())).fetchall()
+        return [self._cache_token_row(row) for row in rows]
     
     def follow_via_token(self, follower_id: str, token: str) -> bool:
         """Create a follow relationship using a token."""
@@ -338,9 +853,13 @@ class ClubhouseIdManager(GObject.GObject):
             logger.warning(f"User {follower_id} cannot follow themselves")
             return False
         
+        # One map fault serves both the O(1) duplicate check and the
+        # insert below.
+        following_map = self._get_following_map(follower_id)
+        
         # Check if relationship already exists
-        existing_rel = self.get_follow_relationship(follower_id, token_obj.user_id)
-        if existing_rel:
+        existing_rel = following_map.get(token_obj.user_id)
+        if existing_rel is not None and existing_rel.status == 'active':
             logger.info(f"Follow relationship already exists between {follower_id} and {token_obj.user_id}")
             return True
         
@@ -352,54 +871,118 @@ class ClubhouseIdManager(GObject.GObject):
             status='active'
         )
         
-        # Store in database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO follow_relationships 
-                (follower_id, following_id, followed_via_token, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                relationship.follower_id,
-                relationship.following_id,
-                relationship.followed_via_token,
-                relationship.status,
-                relationship.created_at.isoformat(),
-                relationship.updated_at.isoformat()
-            ))
-        
-        # Update cache
-        if follower_id not in self._relationships_cache:
-            self._relationships_cache[follower_id] = []
-        self._relationships_cache[follower_id].append(relationship)
-        
-        self.emit('follow-relationship-created', follower_id, token_obj.user_id, token)
+        # Update cache synchronously, then hand the insert to the writer
+        # thread; the signal fires once the row has been committed.
+        following_map[relationship.following_id] = relationship
+        self._following_lists.pop(follower_id, None)
+        self._followers_cache.pop(relationship.following_id, None)
+
+        following_id = token_obj.user_id
+        self._enqueue_write(_SQL_INSERT_RELATIONSHIP, (
+            relationship.follower_id,
+            relationship.following_id,
+            relationship.followed_via_token,
+            relationship.status,
+            relationship.created_at_ms,
+            relationship.updated_at_ms
+        ), lambda: self.emit('follow-relationship-created',
+                             follower_id, following_id, token))
+        self._bump_write_gen()
         logger.info(f"Created follow relationship: {follower_id} -> {token_obj.user_id} via token {token}")
         
         return True
     
+    def bulk_follow_via_tokens(self, follower_id: str, tokens: List[str]) -> int:
+        """Create follow relationships for many tokens in one pass.
+
+        Validates each token, drops self-follows and already-followed
+        targets against the cached following map, then inserts the
+        survivors with a shared timestamp -- the per-call map faults and
+        cache clears of repeated follow_via_token calls are paid once.
+        Returns the number of relationships created.
+        """
+        following_map = self._get_following_map(follower_id)
+        now_ms = _now_ms()
+        created = 0
+        # Bind the per-iteration callables once; in a batch of hundreds
+        # the repeated bound-method creation is measurable.
+        validate = self.validate_token
+        enqueue = self._enqueue_write
+        drop_followers_entry = self._followers_cache.pop
+        for token in tokens:
+            token_obj = validate(token)
+            if token_obj is None:
+                continue
+            following_id = token_obj.user_id
+            if following_id == follower_id or following_id in following_map:
+                continue
+            relationship = ClubhouseFollowRelationship(
+                follower_id=follower_id,
+                following_id=following_id,
+                followed_via_token=token,
+                status='active',
+                _now_ms_value=now_ms
+            )
+            following_map[following_id] = relationship
+            drop_followers_entry(following_id, None)
+            enqueue(_SQL_INSERT_RELATIONSHIP, (
+                relationship.follower_id,
+                relationship.following_id,
+                relationship.followed_via_token,
+                relationship.status,
+                relationship.created_at_ms,
+                relationship.updated_at_ms
+            ), lambda following_id=following_id, token=token: self.emit(
+                'follow-relationship-created', follower_id, following_id, token))
+            created += 1
+        if created:
+            self._following_lists.pop(follower_id, None)
+            self._bump_write_gen()
+            logger.info(f"Bulk-created {created} follow relationships for {follower_id}")
+        return created
+
     def get_follow_relationship(self, follower_id: str, following_id: str) -> Optional[ClubhouseFollowRelationship]:
         """Get a specific follow relationship."""
-        if follower_id not in self._relationships_cache:
-            return None
-        
-        for rel in self._relationships_cache[follower_id]:
-            if rel.following_id == following_id and rel.status == 'active':
-                return rel
+        relationship = self._get_following_map(follower_id).get(following_id)
+        if relationship is not None and relationship.status == 'active':
+            return relationship
         
         return None
-    
+
+    def _get_following_map(self, user_id: str) -> Dict[str, ClubhouseFollowRelationship]:
+        """Get the cached following_id -> relationship map for a user."""
+        relationships = self._relationships_cache.get(user_id)
+        if relationships is None:
+            relationships = self._load_following(user_id)
+        return relationships
+
     def get_following_list(self, user_id: str) -> List[ClubhouseFollowRelationship]:
         """Get list of users that a user is following."""
-        return self._relationships_cache.get(user_id, [])
+        following = self._following_lists.get(user_id)
+        if following is None:
+            following = list(self._get_following_map(user_id).values())
+            self._following_lists[user_id] = following
+        return following
     
     def get_followers_list(self, user_id: str) -> List[ClubhouseFollowRelationship]:
         """Get list of users that are following a user."""
-        followers = []
-        for relationships in self._relationships_cache.values():
-            for rel in relationships:
-                if rel.following_id == user_id and rel.status == 'active':
-                    followers.append(rel)
-        return followers
+        followers = self._followers_cache.get(user_id)
+        if followers is None:
+            followers = self._load_followers(user_id)
+            self._followers_cache[user_id] = followers
+        return list(followers)
+
+    def _load_followers(self, user_id: str) -> Tuple[ClubhouseFollowRelationship, ...]:
+        """Fetch a user's followers via the indexed reverse SQL lookup."""
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            cursor = conn.execute('''
+                SELECT follower_id, following_id, followed_via_token, status,
+                       created_at, updated_at
+                FROM follow_relationships
+                WHERE following_id = ? AND status = 'active'
+            ''', (user_id,))
+            return tuple(ClubhouseFollowRelationship._from_row(row) for row in cursor)
     
     def unfollow(self, follower_id: str, following_id: str) -> bool:
         """Remove a follow relationship."""
@@ -407,135 +990,203 @@ class ClubhouseIdManager(GObject.GObject):
         if not relationship:
             return False
         
-        # Update status in database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE follow_relationships 
-                SET status = 'inactive', updated_at = ?
-                WHERE follower_id = ? AND following_id = ?
-            ''', (datetime.now().isoformat(), follower_id, following_id))
+        # Update status in database via the writer thread
+        self._enqueue_write(_SQL_DEACTIVATE_RELATIONSHIP,
+                            (_now_ms(), follower_id, following_id))
         
         # Remove from cache
-        if follower_id in self._relationships_cache:
-            self._relationships_cache[follower_id] = [
-                rel for rel in self._relationships_cache[follower_id]
-                if not (rel.following_id == following_id and rel.status == 'active')
-            ]
-        
-        self.emit('follow-relationship-updated', follower_id, following_id, 'inactive')
+        following_map = self._relationships_cache.get(follower_id)
+        if following_map is not None:
+            following_map.pop(following_id, None)
+        self._following_lists.pop(follower_id, None)
+        self._followers_cache.pop(following_id, None)
+
+        self._bump_write_gen()
+        GLib.idle_add(self.emit, 'follow-relationship-updated',
+                      follower_id, following_id, 'inactive')
         logger.info(f"Removed follow relationship: {follower_id} -> {following_id}")
         
         return True
     
     def get_clubhouse_id_info(self, clubhouse_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a clubhouse ID."""
-        tokens = self.get_tokens_by_clubhouse_id(clubhouse_id)
-        if not tokens:
-            return None
-        
-        # Get the most recent token
-        latest_token = max(tokens, key=lambda t: t.created_at)
+        # Serve repeat lookups from cache while no write has happened
+        # since the last computation.
+        cached = self._info_cache.get(clubhouse_id)
+        if cached is not None and cached[0] == self._write_gen:
+            return cached[1]
         
-        followers = self.get_followers_list(latest_token.user_id)
-        following = self.get_following_list(latest_token.user_id)
-        
-        return {
+        # Capture the generation before waiting and querying: a write
+        # landing while the queries run bumps the generation first, so
+        # the entry stored below is already stale and must not be keyed
+        # to the new generation.
+        gen = self._write_gen
+
+        # Let SQLite aggregate over its indexes instead of materializing
+        # every token and relationship as Python objects.
+        self._wait_for_writes()
+        now_ms = _now_ms()
+        with self._lock, self._conn as conn:
+            token_row = conn.execute('''
+                SELECT user_id, created_at, last_used, metadata
+                FROM clubhouse_tokens
+                WHERE clubhouse_id = ? AND expires_at > ?
+                ORDER BY created_at DESC
+                LIMIT 1
+            ''', (clubhouse_id, now_ms)).fetchone()
+
+            if token_row is None:
+                self._info_cache[clubhouse_id] = (gen, None)
+                return None
+            user_id, created_at_ms, last_used_ms, metadata = token_row
+
+            active_tokens = conn.execute('''
+                SELECT COUNT(*) FROM clubhouse_tokens
+                WHERE clubhouse_id = ? AND expires_at > ?
+            ''', (clubhouse_id, now_ms)).fetchone()[0]
+
+            followers_count = conn.execute('''
+                SELECT COUNT(*) FROM follow_relationships
+                WHERE following_id = ? AND status = 'active'
+            ''', (user_id,)).fetchone()[0]
+
+            following_count = conn.execute('''
+                SELECT COUNT(*) FROM follow_relationships
+                WHERE follower_id = ? AND status = 'active'
+            ''', (user_id,)).fetchone()[0]
+
+        info = {
             'clubhouse_id': clubhouse_id,
-            'user_id': latest_token.user_id,
-            'active_tokens': len(tokens),
-            'followers_count': len(followers),
-            'following_count': len(following),
-            'created_at': latest_token.created_at.isoformat(),
-            'last_used': latest_token.last_used.isoformat(),
-            'metadata': latest_token.metadata
+            'user_id': user_id,
+            'active_tokens': active_tokens,
+            'followers_count': followers_count,
+            'following_count': following_count,
+            'created_at': _ms_to_datetime(created_at_ms).isoformat(),
+            'last_used': _ms_to_datetime(last_used_ms).isoformat(),
+            'metadata': _load_metadata(metadata)
         }
+        self._info_cache[clubhouse_id] = (gen, info)
+        return info
     
     def revoke_token(self, token: str) -> bool:
         """Revoke a specific token."""
-        if token not in self._tokens_cache:
+        shard = self._shard_for(token)
+        with self._shard_locks[shard]:
+            token_obj = self._token_shards[shard].pop(token, None)
+        if token_obj is None:
             return False
-        
+
         # Remove from database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('DELETE FROM clubhouse_tokens WHERE token = ?', (token,))
-        
-        # Remove from cache
-        del self._tokens_cache[token]
-        
+        with self._lock:
+            self._pending_last_used.pop(token, None)
+        self._enqueue_write(_SQL_DELETE_TOKEN, (token,))
+
+        self._unindex_token(token_obj)
+        self._validation_memo.pop(token, None)
+        self._bump_write_gen()
+
         logger.info(f"Revoked token {token}")
         return True
     
     def revoke_user_tokens(self, user_id: str) -> int:
         """Revoke all tokens for a user."""
-        tokens_to_revoke = [token for token, obj in self._tokens_cache.items() if obj.user_id == user_id]
-        
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            tokens_to_revoke = [row[0] for row in conn.execute(
+                'SELECT token FROM clubhouse_tokens WHERE user_id = ?',
+                (user_id,))]
+
         if not tokens_to_revoke:
             return 0
         
         # Remove from database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('DELETE FROM clubhouse_tokens WHERE user_id = ?', (user_id,))
+        self._enqueue_write('DELETE FROM clubhouse_tokens WHERE user_id = ?',
+                            (user_id,))
         
         # Remove from cache
         for token in tokens_to_revoke:
-            del self._tokens_cache[token]
-        
+            shard = self._shard_for(token)
+            with self._shard_locks[shard]:
+                token_obj = self._token_shards[shard].pop(token, None)
+            if token_obj is not None:
+                self._unindex_token(token_obj)
+            self._validation_memo.pop(token, None)
+        self._bump_write_gen()
+
         logger.info(f"Revoked {len(tokens_to_revoke)} tokens for user {user_id}")
         return len(tokens_to_revoke)
     
     def cleanup_expired_tokens(self) -> int:
         """Remove expired tokens from database and cache."""
-        expired_tokens = []
-        
-        for token, token_obj in self._tokens_cache.items():
-            if not token_obj.is_valid():
-                expired_tokens.append(token)
-        
+        # DELETE ... RETURNING does the scan, the delete and the reporting
+        # in one round trip; only the rows that actually expired come back.
+        self._wait_for_writes()
+        with self._lock, self._conn as conn:
+            cursor = conn.execute('''
+                DELETE FROM clubhouse_tokens
+                WHERE expires_at <= ?
+                RETURNING token
+            ''', (_now_ms(),))
+            expired_tokens = [row[0] for row in cursor]
+
         if not expired_tokens:
             return 0
-        
-        # Remove from database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                DELETE FROM clubhouse_tokens 
-                WHERE expires_at <= datetime('now')
-            ''')
-        
-        # Remove from cache
+
+        # Purge whatever was cached
         for token in expired_tokens:
-            del self._tokens_cache[token]
+            shard = self._shard_for(token)
+            with self._shard_locks[shard]:
+                token_obj = self._token_shards[shard].pop(token, None)
+            if token_obj is not None:
+                self._unindex_token(token_obj)
+            self._validation_memo.pop(token, None)
+        self._bump_write_gen()
         
         logger.info(f"Cleaned up {len(expired_tokens)} expired tokens")
         return len(expired_tokens)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the token and following system."""
-        active_tokens = len(self._tokens_cache)
-        total_relationships = sum(len(rels) for rels in self._relationships_cache.values())
-        
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('SELECT COUNT(*) FROM clubhouse_tokens')
-            total_tokens = cursor.fetchone()[0]
-            
-            cursor = conn.execute('SELECT COUNT(*) FROM follow_relationships')
-            total_all_relationships = cursor.fetchone()[0]
-        
+        # The caches only hold recently used entries, so the counts all come
+        # from indexed SQL aggregates.
+        self._wait_for_writes()
+        now_ms = _now_ms()
+        with self._lock, self._conn as conn:
+            active_tokens = conn.execute(
+                'SELECT COUNT(*) FROM clubhouse_tokens WHERE expires_at > ?',
+                (now_ms,)).fetchone()[0]
+            total_tokens = conn.execute(
+                'SELECT COUNT(*) FROM clubhouse_tokens').fetchone()[0]
+            active_relationships = conn.execute(
+                "SELECT COUNT(*) FROM follow_relationships WHERE status = 'active'"
+            ).fetchone()[0]
+            total_relationships = conn.execute(
+                'SELECT COUNT(*) FROM follow_relationships').fetchone()[0]
+            unique_users = conn.execute(
+                'SELECT COUNT(DISTINCT user_id) FROM clubhouse_tokens'
+                ' WHERE expires_at > ?', (now_ms,)).fetchone()[0]
+
         return {
             'active_tokens': active_tokens,
             'total_tokens': total_tokens,
-            'active_relationships': total_relationships,
-            'total_relationships': total_all_relationships,
-            'unique_users': len(set(token.user_id for token in self._tokens_cache.values()))
+            'active_relationships': active_relationships,
+            'total_relationships': total_relationships,
+            'unique_users': unique_users
         }
 
 
 # Global instance
 _clubhouse_id_manager = None
+_manager_lock = threading.Lock()
 
 
 def get_clubhouse_id_manager() -> ClubhouseIdManager:
     """Get the global clubhouse ID manager instance."""
     global _clubhouse_id_manager
+    # Double-checked locking: the unlocked fast path keeps steady-state
+    # calls lock-free while racing first callers construct exactly once.
     if _clubhouse_id_manager is None:
-        _clubhouse_id_manager = ClubhouseIdManager()
+        with _manager_lock:
+            if _clubhouse_id_manager is None:
+                _clubhouse_id_manager = ClubhouseIdManager()
     return _clubhouse_id_manager
\ No newline at end of file
@@ -14,10 +14,18 @@ gi.require_version("GdkPixbuf", "2.0")
 
 import json
 import logging
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
-from gi.repository import Gtk, GdkPixbuf, GObject, Gdk, Gio
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from gi.repository import Gtk, GdkPixbuf, GLib, GObject, Gdk, Gio, Pango
 from eosclubhouse.clubhouse_id_manager import (
     get_clubhouse_id_manager, 
     ClubhouseIdToken, 
@@ -27,144 +35,319 @@ from eosclubhouse.widgets import gtk_widget_add_custom_css_provider
 
 logger = logging.getLogger(__name__)
 
+# Styling the row labels via CSS classes lets them carry plain text, so
+# Pango never parses markup for them and a fixed width plus ellipsizing
+# short-circuits its remeasure during allocation.  Row styling hangs off
+# a single class on each list rather than one add_class per row.
+_ROW_CSS = b'''
+.token-label { font-weight: bold; }
+.user-label { font-weight: bold; }
+.muted-label { font-size: smaller; }
+.ok { color: green; }
+.err { color: red; }
+.token-list row, .follow-list row { padding: 6px; }
+'''
+
+_row_css_provider = None
+
+# Serialized once at import; rebuilding this JSON on every dialog open
+# just delays the dialog.
+_DEFAULT_METADATA_JSON = json.dumps({
+    "generated_by": "clubhouse_ui",
+    "purpose": "user_following"
+}, indent=2)
+
+# Module-level manager cache so per-click handlers don't go through the
+# singleton factory (and its locking) on every UI action.
+_MANAGER = None
+
+
+def _mgr():
+    """Return the cached ClubhouseIdManager instance."""
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = get_clubhouse_id_manager()
+    return _MANAGER
+
+
+def _run_async(fn, *args, on_done=None):
+    """Run fn(*args) on a worker thread, keeping the main loop free.
+
+    on_done (if any) receives the result back on the main loop.
+    """
+    def _worker():
+        result = fn(*args)
+        if on_done is not None:
+            GLib.idle_add(on_done, result)
+    threading.Thread(target=_worker, daemon=True).start()
+
+
+def _ensure_row_css(widget):
+    """Install the shared row CSS (once) on the widget's screen."""
+    global _row_css_provider
+    if _row_css_provider is None:
+        _row_css_provider = gtk_widget_add_custom_css_provider(widget, for_screen=True)
+        _row_css_provider.load_from_data(_ROW_CSS)
+
+
+_STATS_TMPL = (
+    "System Statistics:\n"
+    "• Active Tokens: {active_tokens}\n"
+    "• Total Tokens: {total_tokens}\n"
+    "• Active Relationships: {active_relationships}\n"
+    "• Total Relationships: {total_relationships}\n"
+    "• Unique Users: {unique_users}\n\n"
+)
 
-class TokenDisplayWidget(Gtk.Box):
+_CLUBHOUSE_STATS_TMPL = (
+    "Your Clubhouse ({clubhouse_id}) Statistics:\n"
+    "• Your Followers: {followers_count}\n"
+    "• You're Following: {following_count}\n"
+    "• Your Active Tokens: {active_tokens}\n"
+)
+
+
+# The same strings get re-rendered for unchanged tokens on every refresh;
+# memoizing on the distinguishing fields skips the formatting entirely.
+# Status colouring comes from the .ok/.err CSS classes, so the labels
+# hold plain text and Pango never parses markup for them.
+@lru_cache(maxsize=4096)
+def _status_text(is_valid, days_left):
+    """Build the status text for a validity/days-left pair."""
+    if is_valid:
+        return f"Valid (expires in {days_left} days)"
+    return "Expired"
+
+
+@lru_cache(maxsize=4096)
+def _token_row_text(token_first8, clubhouse_id):
+    """Build the static label texts for a token row."""
+    return f"Token: {token_first8}...", f"Clubhouse ID: {clubhouse_id}"
+
+
+def _token_status(token, now=None):
+    """Return the status text and validity for a token."""
+    if token.is_valid():
+        days_left = (token.expires_at - (now or datetime.now())).days
+        return _status_text(True, days_left), True
+    return _status_text(False, 0), False
+
+
+def _setup_row_label(label, width_chars, css_class):
+    """Give a row label a fixed width and a styling class."""
+    label.set_width_chars(width_chars)
+    label.set_max_width_chars(width_chars)
+    label.set_ellipsize(Pango.EllipsizeMode.END)
+    label.set_xalign(0.0)
+    label.get_style_context().add_class(css_class)
+
+
+class TokenDisplayWidget(Gtk.Grid):
     """Widget to display token information."""
     
-    def __init__(self, token: ClubhouseIdToken):
-        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+    _token_pixbuf = None
+    _copy_pixbuf = None
+    _revoke_pixbuf = None
+    
+    @classmethod
+    def _ensure_icons(cls):
+        """Resolve the row icons once; rows share the pixbufs."""
+        if cls._token_pixbuf is None:
+            theme = Gtk.IconTheme.get_default()
+            cls._token_pixbuf = theme.load_icon('dialog-password', 16, 0)
+            cls._copy_pixbuf = theme.load_icon('edit-copy', 16, 0)
+            cls._revoke_pixbuf = theme.load_icon('edit-delete', 16, 0)
+    
+    def __init__(self, token: ClubhouseIdToken, manager=None, now=None,
+                 on_revoked=None):
+        # A flat Grid needs one constraint solve per allocation, where the
+        # nested-Box layout re-measured every child while distributing space.
+        super().__init__(column_spacing=12, row_spacing=4)
         self.token = token
-        
-        # Add CSS styling
-        self.get_style_context().add_class('token-display')
+        self._manager = manager or _mgr()
+        self._on_revoked = on_revoked
+        _ensure_row_css(self)
+        self._ensure_icons()
         
         # Token icon
-        self.token_icon = Gtk.Image()
-        self.token_icon.set_from_icon_name('dialog-password', Gtk.IconSize.BUTTON)
-        self.pack_start(self.token_icon, False, False, 0)
+        self.token_icon = Gtk.Image.new_from_pixbuf(self._token_pixbuf)
+        self.token_icon.set_valign(Gtk.Align.CENTER)
+        self.attach(self.token_icon, 0, 0, 1, 3)
         
-        # Token info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        token_text, clubhouse_text = _token_row_text(token.token[:8], token.clubhouse_id)
         
         # Token ID (truncated)
-        token_label = Gtk.Label()
-        token_label.set_markup(f"<b>Token:</b> {token.token[:8]}...")
-        token_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(token_label, False, False, 0)
+        token_label = Gtk.Label(token_text)
+        token_label.set_hexpand(True)
+        _setup_row_label(token_label, 24, 'token-label')
+        self.attach(token_label, 1, 0, 1, 1)
         
         # Clubhouse ID
-        clubhouse_label = Gtk.Label()
-        clubhouse_label.set_markup(f"<b>Clubhouse ID:</b> {token.clubhouse_id}")
-        clubhouse_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(clubhouse_label, False, False, 0)
+        clubhouse_label = Gtk.Label(clubhouse_text)
+        _setup_row_label(clubhouse_label, 32, 'token-label')
+        self.attach(clubhouse_label, 1, 1, 1, 1)
         
         # Expiration status
-        status_label = Gtk.Label()
-        if token.is_valid():
-            days_left = (token.expires_at - datetime.now()).days
-            status_label.set_markup(f"<span color='green'>Valid (expires in {days_left} days)</span>")
-        else:
-            status_label.set_markup(f"<span color='red'>Expired</span>")
-        status_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(status_label, False, False, 0)
-        
-        self.pack_start(info_box, True, True, 0)
-        
-        # Actions
-        actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        self._status_text, is_valid = _token_status(token, now)
+        self._status_label = Gtk.Label(self._status_text)
+        self._status_label.set_halign(Gtk.Align.START)
+        self._status_label.set_max_width_chars(40)
+        self._status_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self._status_label.get_style_context().add_class('ok' if is_valid else 'err')
+        self.attach(self._status_label, 1, 2, 1, 1)
         
         # Copy button
         copy_button = Gtk.Button()
-        copy_button.set_image(Gtk.Image.new_from_icon_name('edit-copy', Gtk.IconSize.BUTTON))
+        copy_button.set_image(Gtk.Image.new_from_pixbuf(self._copy_pixbuf))
         copy_button.set_tooltip_text("Copy token to clipboard")
+        copy_button.set_valign(Gtk.Align.CENTER)
         copy_button.connect('clicked', self._on_copy_clicked)
-        actions_box.pack_start(copy_button, False, False, 0)
+        self.attach(copy_button, 2, 0, 1, 3)
         
         # Revoke button
         revoke_button = Gtk.Button()
-        revoke_button.set_image(Gtk.Image.new_from_icon_name('edit-delete', Gtk.IconSize.BUTTON))
+        revoke_button.set_image(Gtk.Image.new_from_pixbuf(self._revoke_pixbuf))
         revoke_button.set_tooltip_text("Revoke token")
+        revoke_button.set_valign(Gtk.Align.CENTER)
         revoke_button.connect('clicked', self._on_revoke_clicked)
-        actions_box.pack_start(revoke_button, False, False, 0)
-        
-        self.pack_start(actions_box, False, False, 0)
+        self.attach(revoke_button, 3, 0, 1, 3)
         
         self.show_all()
     
+    def update(self, token: ClubhouseIdToken, now=None):
+        """Refresh the status display for an unchanged row."""
+        self.token = token
+        text, is_valid = _token_status(token, now)
+        if text != self._status_text:
+            self._status_text = text
+            self._status_label.set_text(text)
+            context = self._status_label.get_style_context()
+            context.remove_class('err' if is_valid else 'ok')
+            context.add_class('ok' if is_valid else 'err')
+    
     def _on_copy_clicked(self, button):
         """Copy token to clipboard."""
         clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.set_text(self.token.token, -1)
+        # Hand the text out on request instead of pushing it through the
+        # clipboard IPC up front; pasters pull it via the get callback.
+        targets = Gtk.TargetList.new([])
+        targets.add_text_targets(0)
+        try:
+            clipboard.set_with_data(
+                Gtk.target_table_new_from_list(targets),
+                lambda cb, selection, info, data: selection.set_text(self.token.token, -1),
+                lambda cb, data: None, None)
+        except (AttributeError, TypeError):
+            # set_with_data is not introspectable in every PyGObject build.
+            clipboard.set_text(self.token.token, -1)
         logger.info(f"Token {self.token.token[:8]}... copied to clipboard")
     
     def _on_revoke_clicked(self, button):
         """Revoke the token."""
-        manager = get_clubhouse_id_manager()
-        success = manager.revoke_token(self.token.token)
-        if success:
-            logger.info(f"Token {self.token.token[:8]}... revoked")
-            self.set_sensitive(False)
+        button.set_sensitive(False)
+        
+        def _done(success):
+            if success:
+                logger.info(f"Token {self.token.token[:8]}... revoked")
+                self.set_sensitive(False)
+                if self._on_revoked is not None:
+                    self._on_revoked(self.token.token)
+            else:
+                button.set_sensitive(True)
+            return GLib.SOURCE_REMOVE
+        
+        _run_async(self._manager.revoke_token, self.token.token, on_done=_done)
 
 
-class FollowRelationshipWidget(Gtk.Box):
+class FollowRelationshipWidget(Gtk.Grid):
     """Widget to display follow relationship information."""
     
-    def __init__(self, relationship: ClubhouseFollowRelationship, show_follower: bool = True):
-        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+    _avatar_pixbuf = None
+    _unfollow_pixbuf = None
+    
+    @classmethod
+    def _ensure_icons(cls):
+        """Resolve the row icons once; rows share the pixbufs."""
+        if cls._avatar_pixbuf is None:
+            theme = Gtk.IconTheme.get_default()
+            cls._avatar_pixbuf = theme.load_icon('avatar-default', 16, 0)
+            cls._unfollow_pixbuf = theme.load_icon('list-remove', 16, 0)
+    
+    def __init__(self, relationship: ClubhouseFollowRelationship, show_follower: bool = True,
+                 manager=None):
+        super().__init__(column_spacing=12, row_spacing=4)
         self.relationship = relationship
         self.show_follower = show_follower
-        
-        # Add CSS styling
-        self.get_style_context().add_class('follow-relationship')
+        self._manager = manager or _mgr()
+        _ensure_row_css(self)
+        self._ensure_icons()
         
         # User icon
-        user_icon = Gtk.Image()
-        user_icon.set_from_icon_name('avatar-default', Gtk.IconSize.BUTTON)
-        self.pack_start(user_icon, False, False, 0)
-        
-        # User info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        user_icon = Gtk.Image.new_from_pixbuf(self._avatar_pixbuf)
+        user_icon.set_valign(Gtk.Align.CENTER)
+        self.attach(user_icon, 0, 0, 1, 3)
         
         # User ID
         user_id = relationship.follower_id if show_follower else relationship.following_id
-        user_label = Gtk.Label()
-        user_label.set_markup(f"<b>{user_id}</b>")
-        user_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(user_label, False, False, 0)
+        user_label = Gtk.Label(user_id)
+        user_label.set_hexpand(True)
+        _setup_row_label(user_label, 32, 'user-label')
+        self.attach(user_label, 1, 0, 1, 1)
         
         # Relationship info
         rel_info = "Following you" if show_follower else "You are following"
-        rel_label = Gtk.Label()
-        rel_label.set_markup(f"<small>{rel_info}</small>")
-        rel_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(rel_label, False, False, 0)
+        rel_label = Gtk.Label(rel_info)
+        _setup_row_label(rel_label, 24, 'muted-label')
+        self.attach(rel_label, 1, 1, 1, 1)
         
         # Date
-        date_label = Gtk.Label()
         date_str = relationship.created_at.strftime("%Y-%m-%d")
-        date_label.set_markup(f"<small>Since {date_str}</small>")
-        date_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(date_label, False, False, 0)
-        
-        self.pack_start(info_box, True, True, 0)
+        date_label = Gtk.Label(f"Since {date_str}")
+        _setup_row_label(date_label, 24, 'muted-label')
+        self.attach(date_label, 1, 2, 1, 1)
         
         # Unfollow button (only for following, not followers)
         if not show_follower:
             unfollow_button = Gtk.Button()
-            unfollow_button.set_image(Gtk.Image.new_from_icon_name('list-remove', Gtk.IconSize.BUTTON))
+            unfollow_button.set_image(Gtk.Image.new_from_pixbuf(self._unfollow_pixbuf))
             unfollow_button.set_tooltip_text("Unfollow")
+            unfollow_button.set_valign(Gtk.Align.CENTER)
             unfollow_button.connect('clicked', self._on_unfollow_clicked)
-            self.pack_start(unfollow_button, False, False, 0)
+            self.attach(unfollow_button, 2, 0, 1, 3)
         
         self.show_all()
     
     def _on_unfollow_clicked(self, button):
         """Unfollow the user."""
-        manager = get_clubhouse_id_manager()
-        success = manager.unfollow(self.relationship.follower_id, self.relationship.following_id)
-        if success:
-            logger.info(f"Unfollowed {self.relationship.following_id}")
-            self.set_sensitive(False)
+        button.set_sensitive(False)
+        
+        def _done(success):
+            if success:
+                logger.info(f"Unfollowed {self.relationship.following_id}")
+                self.set_sensitive(False)
+            else:
+                button.set_sensitive(True)
+            return GLib.SOURCE_REMOVE
+        
+        _run_async(self._manager.unfollow, self.relationship.follower_id,
+                   self.relationship.following_id, on_done=_done)
+
+
+class _TokenItem(GObject.Object):
+    """GObject wrapper so tokens can live in a Gio.ListStore."""
+    
+    def __init__(self, token: ClubhouseIdToken, now=None):
+        super().__init__()
+        self.token = token
+        self.now = now
+
+
+class _RelationshipItem(GObject.Object):
+    """GObject wrapper so relationships can live in a Gio.ListStore."""
+    
+    def __init__(self, relationship: ClubhouseFollowRelationship):
+        super().__init__()
+        self.relationship = relationship
 
 
 class TokenGeneratorDialog(Gtk.Dialog):
@@ -219,11 +402,7 @@ class TokenGeneratorDialog(Gtk.Dialog):
         
         # Set default metadata
         buffer = self.metadata_textview.get_buffer()
-        default_metadata = {
-            "generated_by": "clubhouse_ui",
-            "purpose": "user_following"
-        }
-        buffer.set_text(json.dumps(default_metadata, indent=2))
+        buffer.set_text(_DEFAULT_METADATA_JSON)
         
         self.show_all()
     
@@ -237,9 +416,15 @@ class TokenGeneratorDialog(Gtk.Dialog):
         end_iter = buffer.get_end_iter()
         metadata_text = buffer.get_text(start_iter, end_iter, False)
         
+        if not metadata_text.strip():
+            return expires_days, {}
+        
+        # orjson parses pasted metadata blocks several times faster than
+        # the stdlib; both raise ValueError subclasses on bad input.
+        loads = orjson.loads if orjson is not None else json.loads
         try:
-            metadata = json.loads(metadata_text) if metadata_text.strip() else {}
-        except json.JSONDecodeError:
+            metadata = loads(metadata_text)
+        except ValueError:
             metadata = {}
         
         return expires_days, metadata
@@ -301,11 +486,27 @@ class FollowViaTokenDialog(Gtk.Dialog):
 class ClubhouseIdManagerView(Gtk.Box):
     """Main view for clubhouse ID management."""
     
+    _STATS_TTL_SECONDS = 2.0
+    
     def __init__(self, user_id: str, clubhouse_id: str):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self.user_id = user_id
         self.clubhouse_id = clubhouse_id
-        self.manager = get_clubhouse_id_manager()
+        self.manager = _mgr()
+        # Signal bursts re-trigger _refresh_stats; a short TTL coalesces
+        # them into one run of the aggregate queries.
+        self._stats_cache = None
+        self._stats_cache_ts = 0.0
+        # Manager signals arrive in bursts (e.g. a sync); invalidations are
+        # collected and flushed as a single idle callback so M events cost
+        # one list rebuild instead of M.
+        self._pending_refresh = set()
+        self._refresh_scheduled = False
+        self._stats_dirty = False
+        # Token strings owned by this view, kept in sync by the token
+        # refresh so follow signals don't need a token query to tell
+        # whether the new follower is ours.
+        self._my_token_strings = set()
         
         self.set_border_width(12)
         
@@ -330,21 +531,23 @@ class ClubhouseIdManagerView(Gtk.Box):
         self.notebook = Gtk.Notebook()
         self.pack_start(self.notebook, True, True, 0)
         
-        # Tokens tab
+        # Tokens tab is the default page and is built eagerly; the other
+        # tabs start as placeholders and get built on first visit, so a
+        # user who never leaves Tokens never pays for them.
         self.tokens_page = self._create_tokens_page()
         self.notebook.append_page(self.tokens_page, Gtk.Label("My Tokens"))
         
-        # Following tab
-        self.following_page = self._create_following_page()
-        self.notebook.append_page(self.following_page, Gtk.Label("Following"))
-        
-        # Followers tab
-        self.followers_page = self._create_followers_page()
-        self.notebook.append_page(self.followers_page, Gtk.Label("Followers"))
-        
-        # Statistics tab
-        self.stats_page = self._create_stats_page()
-        self.notebook.append_page(self.stats_page, Gtk.Label("Statistics"))
+        self._pages_built = {'following': False, 'followers': False, 'stats': False}
+        self._page_titles = {}
+        self._page_names = {}
+        for name, title in (('following', "Following"),
+                            ('followers', "Followers"),
+                            ('stats', "Statistics")):
+            index = self.notebook.append_page(Gtk.Box(), Gtk.Label(title))
+            self._page_names[index] = name
+            self._page_titles[index] = title
+        self._stats_page_index = max(self._page_names)
+        self.notebook.connect('switch-page', self._on_switch_page)
         
         # Connect to manager signals
         self.manager.connect('token-created', self._on_token_created)
@@ -352,103 +555,86 @@ class ClubhouseIdManagerView(Gtk.Box):
         self.manager.connect('follow-relationship-updated', self._on_relationship_updated)
         
         self.show_all()
-        self._refresh_all()
+        self._refresh_tokens()
     
-    def _create_tokens_page(self):
-        """Create the tokens management page."""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+    def _make_list_page(self, title, item_type, row_factory, style_class,
+                        placeholder_text, action_label=None, action_cb=None):
+        """Build one Grid-based list page; returns (page, listbox, model).
+
+        The four tabs shared ~20 lines of Box/ScrolledWindow/ListBox
+        scaffolding each; one factory means one flat Grid per page and a
+        single place to tune the list setup.
+        """
+        page = Gtk.Grid(row_spacing=12, column_spacing=6)
         page.set_border_width(12)
         
-        # Header with action buttons
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        title_label = Gtk.Label(title)
+        title_label.set_halign(Gtk.Align.START)
+        title_label.set_hexpand(True)
+        page.attach(title_label, 0, 0, 1, 1)
         
-        tokens_label = Gtk.Label("My Tokens")
-        tokens_label.set_halign(Gtk.Align.START)
-        header_box.pack_start(tokens_label, True, True, 0)
+        if action_label is not None:
+            action_button = Gtk.Button(action_label)
+            action_button.set_image(Gtk.Image.new_from_icon_name('list-add', Gtk.IconSize.BUTTON))
+            action_button.connect('clicked', action_cb)
+            page.attach(action_button, 1, 0, 1, 1)
         
-        # Generate token button
-        generate_button = Gtk.Button("Generate New Token")
-        generate_button.set_image(Gtk.Image.new_from_icon_name('list-add', Gtk.IconSize.BUTTON))
-        generate_button.connect('clicked', self._on_generate_token_clicked)
-        header_box.pack_start(generate_button, False, False, 0)
-        
-        page.pack_start(header_box, False, False, 0)
-        
-        # Tokens list
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        
-        self.tokens_listbox = Gtk.ListBox()
-        self.tokens_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        scrolled.add(self.tokens_listbox)
-        
-        page.pack_start(scrolled, True, True, 0)
-        
+        scrolled.set_vexpand(True)
+        
+        # The ListBox is bound to a Gio.ListStore so a refresh is a single
+        # splice on the model; only changed rows get (re)materialized.
+        model = Gio.ListStore.new(item_type)
+        listbox = Gtk.ListBox()
+        listbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        listbox.get_style_context().add_class(style_class)
+        listbox.bind_model(model, row_factory)
+        # The ListBox shows the placeholder whenever the model is empty,
+        # replacing the explicit empty-state rows of the unbound design.
+        placeholder = Gtk.Label(placeholder_text)
+        placeholder.show()
+        listbox.set_placeholder(placeholder)
+        scrolled.add(listbox)
+        
+        page.attach(scrolled, 0, 1, 2, 1)
+        
+        return page, listbox, model
+    
+    def _create_tokens_page(self):
+        """Create the tokens management page."""
+        page, self.tokens_listbox, self.tokens_model = self._make_list_page(
+            "My Tokens", _TokenItem, self._make_token_row, 'token-list',
+            "No tokens found",
+            action_label="Generate New Token",
+            action_cb=self._on_generate_token_clicked)
         return page
     
     def _create_following_page(self):
         """Create the following management page."""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_border_width(12)
-        
-        # Header with action buttons
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        
-        following_label = Gtk.Label("Following")
-        following_label.set_halign(Gtk.Align.START)
-        header_box.pack_start(following_label, True, True, 0)
-        
-        # Follow via token button
-        follow_button = Gtk.Button("Follow via Token")
-        follow_button.set_image(Gtk.Image.new_from_icon_name('list-add', Gtk.IconSize.BUTTON))
-        follow_button.connect('clicked', self._on_follow_via_token_clicked)
-        header_box.pack_start(follow_button, False, False, 0)
-        
-        page.pack_start(header_box, False, False, 0)
-        
-        # Following list
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        
-        self.following_listbox = Gtk.ListBox()
-        self.following_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        scrolled.add(self.following_listbox)
-        
-        page.pack_start(scrolled, True, True, 0)
-        
+        page, self.following_listbox, self.following_model = self._make_list_page(
+            "Following", _RelationshipItem, self._make_following_row, 'follow-list',
+            "Not following anyone",
+            action_label="Follow via Token",
+            action_cb=self._on_follow_via_token_clicked)
         return page
     
     def _create_followers_page(self):
         """Create the followers page."""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        page.set_border_width(12)
-        
-        # Header
-        followers_label = Gtk.Label("Followers")
-        followers_label.set_halign(Gtk.Align.START)
-        page.pack_start(followers_label, False, False, 0)
-        
-        # Followers list
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        
-        self.followers_listbox = Gtk.ListBox()
-        self.followers_listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        scrolled.add(self.followers_listbox)
-        
-        page.pack_start(scrolled, True, True, 0)
-        
+        page, self.followers_listbox, self.followers_model = self._make_list_page(
+            "Followers", _RelationshipItem, self._make_follower_row, 'follow-list',
+            "No followers")
         return page
     
     def _create_stats_page(self):
         """Create the statistics page."""
-        page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        page = Gtk.Grid(row_spacing=12)
         page.set_border_width(12)
         
         # Header
         stats_label = Gtk.Label("Statistics")
         stats_label.set_halign(Gtk.Align.START)
-        page.pack_start(stats_label, False, False, 0)
+        page.attach(stats_label, 0, 0, 1, 1)
         
         # Stats display
         self.stats_textview = Gtk.TextView()
@@ -457,9 +643,10 @@ class ClubhouseIdManagerView(Gtk.Box):
         
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_vexpand(True)
         scrolled.add(self.stats_textview)
         
-        page.pack_start(scrolled, True, True, 0)
+        page.attach(scrolled, 0, 1, 1, 1)
         
         return page
     
@@ -493,37 +680,53 @@ class ClubhouseIdManagerView(Gtk.Box):
         if response == Gtk.ResponseType.OK:
             token = dialog.get_token()
             if token:
-                success = self.manager.follow_via_token(self.user_id, token)
-                if success:
-                    logger.info(f"Successfully followed user via token {token[:8]}...")
-                    self._refresh_following()
-                else:
-                    logger.warning(f"Failed to follow user via token {token[:8]}...")
+                def _done(success):
+                    if success:
+                        logger.info(f"Successfully followed user via token {token[:8]}...")
+                        self._refresh_following()
+                    else:
+                        logger.warning(f"Failed to follow user via token {token[:8]}...")
+                    return GLib.SOURCE_REMOVE
+                
+                _run_async(self.manager.follow_via_token, self.user_id, token,
+                           on_done=_done)
         
         dialog.destroy()
     
+    def _schedule_refresh(self, kind):
+        """Queue a list refresh, coalescing bursts into one idle flush."""
+        self._pending_refresh.add(kind)
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            GLib.idle_add(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        """Run the refreshes collected since the last idle tick."""
+        pending, self._pending_refresh = self._pending_refresh, set()
+        self._refresh_scheduled = False
+        for kind in pending:
+            getattr(self, '_refresh_' + kind)()
+        return GLib.SOURCE_REMOVE
+    
     def _on_token_created(self, manager, user_id, token):
         """Handle token created signal."""
         if user_id == self.user_id:
-            self._refresh_tokens()
+            self._schedule_refresh('tokens')
     
     def _on_relationship_created(self, manager, follower_id, following_id, token):
         """Handle relationship created signal."""
         if follower_id == self.user_id:
-            self._refresh_following()
+            self._schedule_refresh('following')
         # Check if someone followed us
-        user_tokens = self.manager.get_user_tokens(self.user_id)
-        for user_token in user_tokens:
-            if user_token.token == token:
-                self._refresh_followers()
-                break
+        if token in self._my_token_strings:
+            self._schedule_refresh('followers')
     
     def _on_relationship_updated(self, manager, follower_id, following_id, status):
         """Handle relationship updated signal."""
         if follower_id == self.user_id:
-            self._refresh_following()
+            self._schedule_refresh('following')
         if following_id == self.user_id:
-            self._refresh_followers()
+            self._schedule_refresh('followers')
     
     def _refresh_all(self):
         """Refresh all data."""
@@ -532,80 +735,117 @@ class ClubhouseIdManagerView(Gtk.Box):
         self._refresh_followers()
         self._refresh_stats()
     
+    def _make_token_row(self, item):
+        """Row factory for the tokens model."""
+        return TokenDisplayWidget(item.token, manager=self.manager, now=item.now,
+                                  on_revoked=self._on_token_revoked)
+    
+    def _on_token_revoked(self, token):
+        """Prune a revoked token and refresh the list it came from."""
+        self._my_token_strings.discard(token)
+        self._schedule_refresh('tokens')
+    
+    def _make_following_row(self, item):
+        """Row factory for the following model."""
+        return FollowRelationshipWidget(item.relationship, show_follower=False,
+                                        manager=self.manager)
+    
+    def _make_follower_row(self, item):
+        """Row factory for the followers model."""
+        return FollowRelationshipWidget(item.relationship, show_follower=True,
+                                        manager=self.manager)
+    
     def _refresh_tokens(self):
         """Refresh tokens list."""
-        # Clear existing tokens
-        for child in self.tokens_listbox.get_children():
-            self.tokens_listbox.remove(child)
-        
-        # Add current tokens
+        now = datetime.now()
         tokens = self.manager.get_user_tokens(self.user_id)
-        for token in tokens:
-            token_widget = TokenDisplayWidget(token)
-            self.tokens_listbox.add(token_widget)
-        
-        if not tokens:
-            no_tokens_label = Gtk.Label("No tokens found")
-            no_tokens_label.set_halign(Gtk.Align.CENTER)
-            self.tokens_listbox.add(no_tokens_label)
-        
-        self.tokens_listbox.show_all()
+        self._my_token_strings = {token.token for token in tokens}
+        model = self.tokens_model
+        n_items = model.get_n_items()
+        
+        # Rows whose token is unchanged keep their widget: update() only
+        # touches the status label, so a periodic refresh of a stable
+        # list rebuilds nothing.  Only the changed tail is spliced, and
+        # the bound ListBox sees one items-changed notification for it.
+        keep = 0
+        while keep < n_items and keep < len(tokens):
+            item = model.get_item(keep)
+            if item.token.token != tokens[keep].token:
+                break
+            item.token = tokens[keep]
+            item.now = now
+            row = self.tokens_listbox.get_row_at_index(keep)
+            if row is not None:
+                row.get_child().update(tokens[keep], now)
+            keep += 1
+        
+        model.splice(keep, n_items - keep,
+                     [_TokenItem(token, now) for token in tokens[keep:]])
     
     def _refresh_following(self):
         """Refresh following list."""
-        # Clear existing following
-        for child in self.following_listbox.get_children():
-            self.following_listbox.remove(child)
-        
-        # Add current following
-        following = self.manager.get_following_list(self.user_id)
-        for rel in following:
-            follow_widget = FollowRelationshipWidget(rel, show_follower=False)
-            self.following_listbox.add(follow_widget)
-        
-        if not following:
-            no_following_label = Gtk.Label("Not following anyone")
-            no_following_label.set_halign(Gtk.Align.CENTER)
-            self.following_listbox.add(no_following_label)
-        
-        self.following_listbox.show_all()
+        if not self._pages_built['following']:
+            return
+        items = [_RelationshipItem(rel)
+                 for rel in self.manager.get_following_list(self.user_id)]
+        self.following_model.splice(0, self.following_model.get_n_items(), items)
     
     def _refresh_followers(self):
         """Refresh followers list."""
-        # Clear existing followers
-        for child in self.followers_listbox.get_children():
-            self.followers_listbox.remove(child)
-        
-        # Add current followers
-        followers = self.manager.get_followers_list(self.user_id)
-        for rel in followers:
-            follower_widget = FollowRelationshipWidget(rel, show_follower=True)
-            self.followers_listbox.add(follower_widget)
-        
-        if not followers:
-            no_followers_label = Gtk.Label("No followers")
-            no_followers_label.set_halign(Gtk.Align.CENTER)
-            self.followers_listbox.add(no_followers_label)
-        
-        self.followers_listbox.show_all()
+        if not self._pages_built['followers']:
+            return
+        items = [_RelationshipItem(rel)
+                 for rel in self.manager.get_followers_list(self.user_id)]
+        self.followers_model.splice(0, self.followers_model.get_n_items(), items)
     
-    def _refresh_stats(self):
+    def _on_switch_page(self, notebook, page, page_num):
+        """Build lazy tabs on first visit; render deferred statistics."""
+        name = self._page_names.get(page_num)
+        if name is None:
+            return
+        
+        if not self._pages_built[name]:
+            self._pages_built[name] = True
+            new_page = getattr(self, '_create_' + name + '_page')()
+            new_page.show_all()
+            setattr(self, name + '_page', new_page)
+            notebook.remove_page(page_num)
+            notebook.insert_page(new_page, Gtk.Label(self._page_titles[page_num]), page_num)
+            GLib.idle_add(notebook.set_current_page, page_num)
+            if name == 'stats':
+                self._refresh_stats(page_num=page_num)
+            else:
+                getattr(self, '_refresh_' + name)()
+        elif name == 'stats' and self._stats_dirty:
+            self._refresh_stats(page_num=page_num)
+    
+    def _refresh_stats(self, page_num=None):
         """Refresh statistics."""
-        stats = self.manager.get_statistics()
-        clubhouse_info = self.manager.get_clubhouse_id_info(self.clubhouse_id)
-        
-        stats_text = "System Statistics:\n"
-        stats_text += f"• Active Tokens: {stats['active_tokens']}\n"
-        stats_text += f"• Total Tokens: {stats['total_tokens']}\n"
-        stats_text += f"• Active Relationships: {stats['active_relationships']}\n"
-        stats_text += f"• Total Relationships: {stats['total_relationships']}\n"
-        stats_text += f"• Unique Users: {stats['unique_users']}\n\n"
+        # The aggregate queries and the text rebuild are pointless while
+        # another tab is showing; mark dirty and render on tab switch.
+        if not self._pages_built['stats']:
+            self._stats_dirty = True
+            return
+        if page_num is None:
+            page_num = self.notebook.get_current_page()
+        if page_num != self._stats_page_index:
+            self._stats_dirty = True
+            return
+        self._stats_dirty = False
+        
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cache_ts < self._STATS_TTL_SECONDS:
+            stats, clubhouse_info = self._stats_cache
+        else:
+            stats = self.manager.get_statistics()
+            clubhouse_info = self.manager.get_clubhouse_id_info(self.clubhouse_id)
+            self._stats_cache = (stats, clubhouse_info)
+            self._stats_cache_ts = now
         
+        stats_text = _STATS_TMPL.format(**stats)
         if clubhouse_info:
-            stats_text += f"Your Clubhouse ({self.clubhouse_id}) Statistics:\n"
-            stats_text += f"• Your Followers: {clubhouse_info['followers_count']}\n"
-            stats_text += f"• You're Following: {clubhouse_info['following_count']}\n"
-            stats_text += f"• Your Active Tokens: {clubhouse_info['active_tokens']}\n"
+            stats_text += _CLUBHOUSE_STATS_TMPL.format(clubhouse_id=self.clubhouse_id,
+                                                       **clubhouse_info)
         
         buffer = self.stats_textview.get_buffer()
         buffer.set_text(stats_text)
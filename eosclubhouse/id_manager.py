@@ -24,18 +24,75 @@ import gi
 gi.require_version('GObject', '2.0')
 from gi.repository import GObject
 
-import uuid
+import math
+import os
+import re
 import time
 import hashlib
+import hmac
 import json
 import logging
-from typing import Optional, Dict, List, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from collections import defaultdict
+from typing import Optional, Dict, List, Set, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+class _UUIDPool:
+    """Pooled os.urandom source for UUID4 strings.
+
+    Minting an ID normally costs an os.urandom syscall plus uuid.UUID
+    construction; drawing a pool of entropy in one syscall and formatting
+    the string directly makes batch creation much cheaper while staying
+    cryptographically strong.
+    """
+    
+    POOL_SIZE = 4096
+    
+    def __init__(self):
+        self._buf = b''
+        self._offset = 0
+    
+    def take16(self) -> bytes:
+        """Take 16 random bytes from the pool, refilling as needed."""
+        if self._offset + 16 > len(self._buf):
+            self._buf = os.urandom(self.POOL_SIZE)
+            self._offset = 0
+        chunk = self._buf[self._offset:self._offset + 16]
+        self._offset += 16
+        return chunk
+    
+    def uuid4_str(self) -> str:
+        """Format pooled bytes as a canonical UUID4 string."""
+        raw = bytearray(self.take16())
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        hex_str = bytes(raw).hex()
+        return '-'.join((hex_str[:8], hex_str[8:12], hex_str[12:16],
+                         hex_str[16:20], hex_str[20:]))
+
+
+_uuid_pool = _UUIDPool()
+
+# Canonical UUIDs are alphanumeric-plus-hyphens, so one precompiled regex
+# covers them and the custom formats alike -- no exception-driven
+# uuid.UUID parse and no per-character Python loop.
+_ID_RE = re.compile(r'\A[A-Za-z0-9_-]+\Z')
+
+# Module clock indirection: every wall-clock read in this module goes
+# through this binding, so tests can rebind it and advance virtual time
+# instead of sleeping.
+_clock = time.time
+
+
 class IDType(Enum):
     """Types of IDs that can be managed."""
     CLUBHOUSE = "clubhouse"
@@ -54,9 +111,30 @@ class TokenStatus(Enum):
     PENDING = "pending"
 
 
-@dataclass
+# Iterating an Enum class goes through its metaclass machinery; a plain
+# tuple snapshot is what the hot index-reset paths actually need.
+_ID_TYPES = tuple(IDType)
+
+# Dense slot per IDType so the per-type index is a list indexed by int
+# rather than a dict hashed through enum instances.
+_IDTYPE_SLOT = {id_type: slot for slot, id_type in enumerate(_ID_TYPES)}
+
+# Preresolved status members for the hot paths: each TokenStatus.X
+# attribute access goes through the enum metaclass's __getattr__, which
+# shows up when it sits inside a per-token loop.
+_ACTIVE = TokenStatus.ACTIVE
+_EXPIRED = TokenStatus.EXPIRED
+_REVOKED = TokenStatus.REVOKED
+
+
+@dataclass(slots=True)
 class IDRelationship:
-    """Represents a relationship between two IDs via a token."""
+    """Represents a relationship between two IDs via a token.
+
+    expires_at is normalized to math.inf for relationships that never
+    expire, matching the token convention, so expiry checks are plain
+    float comparisons.
+    """
     source_id: str
     target_id: str
     token_id: str
@@ -65,61 +143,68 @@ class IDRelationship:
     expires_at: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
     
-    def is_expired(self) -> bool:
-        """Check if the relationship has expired."""
+    def __post_init__(self):
         if self.expires_at is None:
-            return False
-        return time.time() > self.expires_at
+            self.expires_at = math.inf
+    
+    def is_expired(self, now: float = None) -> bool:
+        """Check if the relationship has expired.
+
+        Callers scanning many relationships can pass a shared clock
+        reading as `now`.
+        """
+        if now is None:
+            now = _clock()
+        return now > self.expires_at
+
 
+class ClubhouseID:
+    """Represents a clubhouse ID with metadata and validation.
 
-class ClubhouseID(GObject.GObject):
-    """Represents a clubhouse ID with metadata and validation."""
+    A plain slotted class: these are bulk data records, and the GObject
+    machinery (floating refs, a GType, a per-instance __dict__) costs
+    real memory and construction time without being used -- nothing
+    connects to signals on them or puts them in GObject properties.
+    """
     
-    __gtype_name__ = 'ClubhouseID'
+    __slots__ = ('_id_value', '_id_type', '_metadata', '_created_at',
+                 '_last_accessed', '_access_count', '_dict_cache')
     
     def __init__(self, id_value: str = None, id_type: IDType = IDType.CLUBHOUSE, 
                  metadata: Dict[str, Any] = None):
-        super().__init__()
-        
-        self._id_value = id_value if id_value is not None else self._generate_id()
+        now = _clock()
+        if id_value is None:
+            # Generated values are known-good UUIDs; skip validation.
+            self._id_value = self._generate_id()
+        else:
+            if not _ID_RE.match(id_value):
+                raise ValueError(f"Invalid ID format: {id_value}")
+            self._id_value = id_value
         self._id_type = id_type
         self._metadata = metadata or {}
-        self._created_at = time.time()
-        self._last_accessed = time.time()
+        self._created_at = now
+        self._last_accessed = now
         self._access_count = 0
-        
-        # Validate ID format
-        if not self._validate_id():
-            raise ValueError(f"Invalid ID format: {self._id_value}")
+        self._dict_cache = None
     
     def _generate_id(self) -> str:
         """Generate a unique ID using UUID4."""
-        return str(uuid.uuid4())
+        return _uuid_pool.uuid4_str()
     
     def _validate_id(self) -> bool:
         """Validate the ID format."""
-        if not self._id_value or len(self._id_value.strip()) == 0:
-            return False
-        
-        # Check if it's a valid UUID
-        try:
-            uuid.UUID(self._id_value)
-            return True
-        except ValueError:
-            # Allow custom ID formats (alphanumeric with hyphens and underscores)
-            # But ensure it's not empty and has valid characters
-            if len(self._id_value) == 0:
-                return False
-            return all(c.isalnum() or c in '-_' for c in self._id_value)
+        return bool(self._id_value) and _ID_RE.match(self._id_value) is not None
     
     def access(self) -> None:
         """Update access tracking."""
-        self._last_accessed = time.time()
+        self._last_accessed = _clock()
         self._access_count += 1
+        self._dict_cache = None
     
     def update_metadata(self, key: str, value: Any) -> None:
         """Update metadata for this ID."""
         self._metadata[key] = value
+        self._dict_cache = None
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata value for this ID."""
@@ -127,14 +212,18 @@ class ClubhouseID(GObject.GObject):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ID to dictionary representation."""
-        return {
-            'id': self._id_value,
-            'type': self._id_type.value,
-            'metadata': self._metadata,
-            'created_at': self._created_at,
-            'last_accessed': self._last_accessed,
-            'access_count': self._access_count
-        }
+        # Memoized until the next mutation; repeated exports of an
+        # unchanged ID then cost a single attribute read.
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self._id_value,
+                'type': self._id_type.value,
+                'metadata': self._metadata,
+                'created_at': self._created_at,
+                'last_accessed': self._last_accessed,
+                'access_count': self._access_count
+            }
+        return self._dict_cache
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ClubhouseID':
@@ -144,9 +233,10 @@ class ClubhouseID(GObject.GObject):
             id_type=IDType(data['type']),
             metadata=data.get('metadata', {})
         )
-        clubhouse_id._created_at = data.get('created_at', time.time())
-        clubhouse_id._last_accessed = data.get('last_accessed', time.time())
+        clubhouse_id._created_at = data.get('created_at', _clock())
+        clubhouse_id._last_accessed = data.get('last_accessed', _clock())
         clubhouse_id._access_count = data.get('access_count', 0)
+        clubhouse_id._dict_cache = None
         return clubhouse_id
     
     @property
@@ -187,80 +277,91 @@ class ClubhouseID(GObject.GObject):
         return self._id_value == other._id_value and self._id_type == other._id_type
 
 
-class TokenID(GObject.GObject):
-    """Represents a token that links two IDs together."""
+class TokenID:
+    """Represents a token that links two IDs together.
+
+    Like ClubhouseID, a plain slotted class rather than a GObject.
+    """
     
-    __gtype_name__ = 'TokenID'
+    __slots__ = ('_source_id', '_target_id', '_token_value', '_created_at',
+                 '_expires_at', '_status', '_metadata', '_usage_count',
+                 '_token_hash', '_dict_cache')
     
     def __init__(self, source_id: str, target_id: str, token_value: str = None,
                  expires_in: Optional[int] = None, metadata: Dict[str, Any] = None):
-        super().__init__()
-        
+        now = _clock()
         self._source_id = source_id
         self._target_id = target_id
         self._token_value = token_value or self._generate_token()
-        self._created_at = time.time()
-        self._expires_at = (time.time() + expires_in) if expires_in else None
+        self._created_at = now
+        # math.inf stands in for "never expires" so every expiry check is
+        # a plain float comparison with no None branch.
+        self._expires_at = (now + expires_in) if expires_in else math.inf
         self._status = TokenStatus.ACTIVE
         self._metadata = metadata or {}
         self._usage_count = 0
+        self._dict_cache = None
         
-        # Generate token hash for security
-        self._token_hash = self._hash_token(self._token_value)
+        # Generate token hash for security.  The raw digest is all the
+        # comparison needs; hex formatting would be pure overhead.
+        self._token_hash = hashlib.sha256(self._token_value.encode()).digest()
     
     def _generate_token(self) -> str:
         """Generate a secure token."""
-        return str(uuid.uuid4()) + "-" + str(int(time.time()))
+        return _uuid_pool.uuid4_str() + "-" + str(int(_clock()))
     
-    def _hash_token(self, token: str) -> str:
-        """Generate SHA256 hash of the token."""
-        return hashlib.sha256(token.encode()).hexdigest()
+    def _hash_token(self, token: str) -> bytes:
+        """Generate the SHA256 digest of a token."""
+        return hashlib.sha256(token.encode()).digest()
     
     def verify_token(self, token: str) -> bool:
         """Verify if the provided token matches this TokenID."""
-        if self._status != TokenStatus.ACTIVE:
+        if self._status is not _ACTIVE:
             return False
         
-        if self.is_expired():
-            self._status = TokenStatus.EXPIRED
+        if _clock() > self._expires_at:
+            self._status = _EXPIRED
+            self._dict_cache = None
             return False
         
-        token_hash = self._hash_token(token)
-        if token_hash == self._token_hash:
+        if hmac.compare_digest(self._hash_token(token), self._token_hash):
             self._usage_count += 1
+            self._dict_cache = None
             return True
         
         return False
     
     def is_expired(self) -> bool:
         """Check if the token has expired."""
-        if self._expires_at is None:
-            return False
-        return time.time() > self._expires_at
+        return _clock() > self._expires_at
     
     def revoke(self) -> None:
         """Revoke the token."""
         self._status = TokenStatus.REVOKED
+        self._dict_cache = None
     
     def extend_expiry(self, additional_seconds: int) -> None:
         """Extend token expiry time."""
-        if self._expires_at:
+        if self._expires_at != math.inf:
             self._expires_at += additional_seconds
         else:
-            self._expires_at = time.time() + additional_seconds
+            self._expires_at = _clock() + additional_seconds
+        self._dict_cache = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert token to dictionary representation."""
-        return {
-            'source_id': self._source_id,
-            'target_id': self._target_id,
-            'token_hash': self._token_hash,
-            'created_at': self._created_at,
-            'expires_at': self._expires_at,
-            'status': self._status.value,
-            'metadata': self._metadata,
-            'usage_count': self._usage_count
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'source_id': self._source_id,
+                'target_id': self._target_id,
+                'token_hash': self._token_hash.hex(),
+                'created_at': self._created_at,
+                'expires_at': self.expires_at,
+                'status': self._status.value,
+                'metadata': self._metadata,
+                'usage_count': self._usage_count
+            }
+        return self._dict_cache
     
     @property
     def source_id(self) -> str:
@@ -289,8 +390,8 @@ class TokenID(GObject.GObject):
     
     @property
     def expires_at(self) -> Optional[float]:
-        """Get expiry timestamp."""
-        return self._expires_at
+        """Get expiry timestamp, or None if the token never expires."""
+        return None if self._expires_at == math.inf else self._expires_at
     
     @property
     def usage_count(self) -> int:
@@ -309,6 +410,13 @@ class IDManager(GObject.GObject):
     
     __gtype_name__ = 'IDManager'
     
+    # Injectable clock: reads the module clock by default; demos and
+    # tests can rebind either this or the module-level _clock to move
+    # time forward deterministically instead of sleeping.
+    @staticmethod
+    def _now() -> float:
+        return _clock()
+    
     def __init__(self):
         super().__init__()
         
@@ -316,10 +424,15 @@ class IDManager(GObject.GObject):
         self._tokens: Dict[str, TokenID] = {}
         self._relationships: List[IDRelationship] = []
         
-        # Index for quick lookups
-        self._id_by_type: Dict[IDType, List[str]] = {id_type: [] for id_type in IDType}
-        self._tokens_by_source: Dict[str, List[str]] = {}
-        self._tokens_by_target: Dict[str, List[str]] = {}
+        # Index for quick lookups, one slot per IDType
+        self._id_by_type: List[Set[str]] = [set() for _ in _ID_TYPES]
+        self._tokens_by_source: Dict[str, List[str]] = defaultdict(list)
+        self._tokens_by_target: Dict[str, List[str]] = defaultdict(list)
+        self._tokens_by_hash: Dict[bytes, TokenID] = {}
+        # Secondary index for the most common query shape: relationships
+        # by (source_id, relationship_type).
+        self._rels_by_source_type: Dict[Tuple[str, str], List[IDRelationship]] = \
+            defaultdict(list)
     
     def create_id(self, id_type: IDType = IDType.CLUBHOUSE, 
                   id_value: str = None, metadata: Dict[str, Any] = None) -> ClubhouseID:
@@ -330,8 +443,7 @@ class IDManager(GObject.GObject):
         self._ids[clubhouse_id.id_value] = clubhouse_id
         
         # Update index
-        if clubhouse_id.id_value not in self._id_by_type[id_type]:
-            self._id_by_type[id_type].append(clubhouse_id.id_value)
+        self._id_by_type[_IDTYPE_SLOT[id_type]].add(clubhouse_id.id_value)
         
         logger.info(f"Created new ID: {clubhouse_id}")
         return clubhouse_id
@@ -342,8 +454,11 @@ class IDManager(GObject.GObject):
     
     def get_ids_by_type(self, id_type: IDType) -> List[ClubhouseID]:
         """Get all IDs of a specific type."""
-        id_values = self._id_by_type.get(id_type, [])
-        return [self._ids[id_val] for id_val in id_values if id_val in self._ids]
+        slot = _IDTYPE_SLOT.get(id_type)
+        if slot is None:
+            return []
+        return [self._ids[id_val] for id_val in self._id_by_type[slot]
+                if id_val in self._ids]
     
     def create_token_link(self, source_id: str, target_id: str, 
                          expires_in: Optional[int] = None,
@@ -359,29 +474,28 @@ class IDManager(GObject.GObject):
         # Create the token
         token = TokenID(source_id, target_id, expires_in=expires_in, metadata=metadata)
         
-        # Store the token
+        # Store the token, also keyed by digest so verification can go
+        # straight from a presented value to its token.
         self._tokens[token.token_value] = token
+        self._tokens_by_hash[token._token_hash] = token
         
         # Update indices
-        if source_id not in self._tokens_by_source:
-            self._tokens_by_source[source_id] = []
         self._tokens_by_source[source_id].append(token.token_value)
-        
-        if target_id not in self._tokens_by_target:
-            self._tokens_by_target[target_id] = []
         self._tokens_by_target[target_id].append(token.token_value)
         
-        # Create relationship
+        # Create relationship; reuse the token's clock reading rather
+        # than hitting the clock a second time per link.
         relationship = IDRelationship(
             source_id=source_id,
             target_id=target_id,
             token_id=token.token_value,
             relationship_type=relationship_type,
-            created_at=time.time(),
+            created_at=token.created_at,
             expires_at=token.expires_at,
             metadata=metadata
         )
         self._relationships.append(relationship)
+        self._rels_by_source_type[(source_id, relationship_type)].append(relationship)
         
         logger.info(f"Created token link: {source_id} -> {target_id} via {token.token_value}")
         return token
@@ -389,68 +503,107 @@ class IDManager(GObject.GObject):
     def verify_token_link(self, token_value: str, source_id: str = None, 
                          target_id: str = None) -> bool:
         """Verify a token link between IDs."""
-        token = self._tokens.get(token_value)
-        if not token:
+        # Look up by digest: one sha256 plus one dict probe replaces the
+        # plaintext lookup followed by a second hash inside verify_token.
+        token = self._tokens_by_hash.get(
+            hashlib.sha256(token_value.encode()).digest())
+        if token is None:
+            return False
+        
+        if token._status is not _ACTIVE:
             return False
         
-        # Verify the token itself
-        if not token.verify_token(token_value):
+        if self._now() > token._expires_at:
+            token._status = _EXPIRED
+            token._dict_cache = None
             return False
         
         # Verify source and target if provided
-        if source_id and token.source_id != source_id:
+        if source_id and token._source_id != source_id:
             return False
-        if target_id and token.target_id != target_id:
+        if target_id and token._target_id != target_id:
             return False
         
+        token._usage_count += 1
+        token._dict_cache = None
         return True
     
+    def verify_batch(self, token_values: List[str]) -> List[bool]:
+        """Verify many token links in one pass.
+
+        Shares one clock reading and locally-bound lookups across the
+        batch instead of paying the per-call overhead of
+        verify_token_link for every value.  The tokens themselves are
+        tiny, so hashing them inline beats farming the digests out to
+        worker threads.
+        """
+        now = self._now()
+        tokens_get = self._tokens.get
+        sha256 = hashlib.sha256
+        results = []
+        append = results.append
+        for token_value in token_values:
+            token = tokens_get(token_value)
+            if token is None or token._status is not _ACTIVE:
+                append(False)
+                continue
+            if now > token._expires_at:
+                token._status = _EXPIRED
+                token._dict_cache = None
+                append(False)
+                continue
+            matched = hmac.compare_digest(sha256(token_value.encode()).digest(),
+                                          token._token_hash)
+            if matched:
+                token._usage_count += 1
+                token._dict_cache = None
+            append(matched)
+        return results
+    
     def get_linked_ids(self, source_id: str, active_only: bool = True) -> List[str]:
         """Get all IDs linked to a source ID."""
-        token_values = self._tokens_by_source.get(source_id, [])
-        linked_ids = []
-        
-        for token_value in token_values:
-            token = self._tokens.get(token_value)
-            if token:
-                if active_only and (token.status != TokenStatus.ACTIVE or token.is_expired()):
-                    continue
-                linked_ids.append(token.target_id)
-        
-        return linked_ids
+        # One comprehension with the dict .get bound locally: the loop
+        # body runs at C speed and skips the repeated self._tokens
+        # attribute lookup.  One clock reading; the inf expiry sentinel
+        # keeps the liveness test a single boolean expression.
+        now = self._now()
+        tokens_get = self._tokens.get
+        return [token._target_id
+                for token_value in self._tokens_by_source.get(source_id, [])
+                if (token := tokens_get(token_value)) is not None and
+                (not active_only or (token._status is _ACTIVE and
+                                     now <= token._expires_at))]
     
     def get_reverse_linked_ids(self, target_id: str, active_only: bool = True) -> List[str]:
         """Get all IDs that link to a target ID."""
-        token_values = self._tokens_by_target.get(target_id, [])
-        linked_ids = []
-        
-        for token_value in token_values:
-            token = self._tokens.get(token_value)
-            if token:
-                if active_only and (token.status != TokenStatus.ACTIVE or token.is_expired()):
-                    continue
-                linked_ids.append(token.source_id)
-        
-        return linked_ids
+        now = self._now()
+        tokens_get = self._tokens.get
+        return [token._source_id
+                for token_value in self._tokens_by_target.get(target_id, [])
+                if (token := tokens_get(token_value)) is not None and
+                (not active_only or (token._status is _ACTIVE and
+                                     now <= token._expires_at))]
     
     def get_relationships(self, source_id: str = None, target_id: str = None,
                          relationship_type: str = None, active_only: bool = True) -> List[IDRelationship]:
         """Get relationships based on criteria."""
-        relationships = []
-        
-        for rel in self._relationships:
-            if source_id and rel.source_id != source_id:
-                continue
-            if target_id and rel.target_id != target_id:
-                continue
-            if relationship_type and rel.relationship_type != relationship_type:
-                continue
-            if active_only and rel.is_expired():
-                continue
-            
-            relationships.append(rel)
-        
-        return relationships
+        # A single comprehension keeps the scan inside the interpreter's
+        # C loop with one clock reading, instead of a Python-level loop
+        # re-reading the clock through is_expired() per element.  When
+        # both source and type are given -- the common query shape --
+        # the secondary index narrows the scan to just those rows.
+        now = self._now()
+        if source_id and relationship_type:
+            candidates = self._rels_by_source_type.get(
+                (source_id, relationship_type), ())
+            return [rel for rel in candidates
+                    if (not target_id or rel.target_id == target_id) and
+                    (not active_only or now <= rel.expires_at)]
+        return [rel for rel in self._relationships
+                if (not source_id or rel.source_id == source_id) and
+                (not target_id or rel.target_id == target_id) and
+                (not relationship_type or rel.relationship_type == relationship_type) and
+                (not active_only or now <= rel.expires_at)]
     
     def revoke_token(self, token_value: str) -> bool:
         """Revoke a token."""
@@ -463,42 +616,85 @@ class IDManager(GObject.GObject):
     
     def cleanup_expired_tokens(self) -> int:
         """Clean up expired tokens and return count of cleaned tokens."""
-        expired_count = 0
-        
-        for token_value, token in list(self._tokens.items()):
-            if token.is_expired():
-                token.revoke()
-                expired_count += 1
+        # One clock reading, then a comprehension to find the stale tokens
+        # and a tight loop to flip them -- the common all-fresh sweep never
+        # executes any mutation code at all.  There is no SQL backend here,
+        # so the single-UPDATE variant of this sweep does not apply.
+        now = self._now()
+        expired = [token for token in self._tokens.values()
+                   if now > token._expires_at and token._status is not _EXPIRED]
+        for token in expired:
+            token._status = _EXPIRED
+            token._dict_cache = None
+        expired_count = len(expired)
         
         # Remove expired relationships
-        active_relationships = [rel for rel in self._relationships if not rel.is_expired()]
+        active_relationships = [rel for rel in self._relationships
+                                if now <= rel.expires_at]
         removed_count = len(self._relationships) - len(active_relationships)
         self._relationships = active_relationships
+        if removed_count:
+            rebuilt: Dict[Tuple[str, str], List[IDRelationship]] = defaultdict(list)
+            for rel in active_relationships:
+                rebuilt[(rel.source_id, rel.relationship_type)].append(rel)
+            self._rels_by_source_type = rebuilt
         
         if expired_count > 0:
             logger.info(f"Cleaned up {expired_count} expired tokens and {removed_count} relationships")
         
         return expired_count
     
+    @staticmethod
+    def _relationship_to_dict(rel: IDRelationship) -> Dict[str, Any]:
+        """Serialize a relationship, mapping the inf sentinel back to None."""
+        return {
+            'source_id': rel.source_id,
+            'target_id': rel.target_id,
+            'token_id': rel.token_id,
+            'relationship_type': rel.relationship_type,
+            'created_at': rel.created_at,
+            'expires_at': None if rel.expires_at == math.inf else rel.expires_at,
+            'metadata': rel.metadata
+        }
+    
     def export_data(self) -> Dict[str, Any]:
         """Export all data to a dictionary."""
         return {
             'ids': {id_val: cid.to_dict() for id_val, cid in self._ids.items()},
             'tokens': {token_val: token.to_dict() for token_val, token in self._tokens.items()},
-            'relationships': [
-                {
-                    'source_id': rel.source_id,
-                    'target_id': rel.target_id,
-                    'token_id': rel.token_id,
-                    'relationship_type': rel.relationship_type,
-                    'created_at': rel.created_at,
-                    'expires_at': rel.expires_at,
-                    'metadata': rel.metadata
-                }
-                for rel in self._relationships
-            ]
+            'relationships': [self._relationship_to_dict(rel)
+                              for rel in self._relationships]
         }
     
+    def iter_export(self):
+        """Stream export records one at a time.
+
+        Yields ('ids' | 'tokens' | 'relationships', key, dict) tuples
+        without materializing the whole export dict, so peak memory
+        stays flat no matter how large the store is.
+        """
+        for id_val, cid in self._ids.items():
+            yield 'ids', id_val, cid.to_dict()
+        for token_val, token in self._tokens.items():
+            yield 'tokens', token_val, token.to_dict()
+        for rel in self._relationships:
+            yield 'relationships', rel.token_id, self._relationship_to_dict(rel)
+    
+    def iter_export_json(self, fp) -> None:
+        """Write the export to a file object as an incremental JSON array."""
+        encoder = json.JSONEncoder()
+        write = fp.write
+        write('[')
+        first = True
+        for section, key, data in self.iter_export():
+            if not first:
+                write(',')
+            first = False
+            for chunk in encoder.iterencode(
+                    {'section': section, 'key': key, 'data': data}):
+                write(chunk)
+        write(']')
+    
     def import_data(self, data: Dict[str, Any]) -> None:
         """Import data from a dictionary."""
         # Clear existing data
@@ -507,15 +703,17 @@ class IDManager(GObject.GObject):
         self._relationships.clear()
         
         # Reset indices
-        self._id_by_type = {id_type: [] for id_type in IDType}
+        self._id_by_type = [set() for _ in _ID_TYPES]
         self._tokens_by_source.clear()
         self._tokens_by_target.clear()
+        self._tokens_by_hash.clear()
+        self._rels_by_source_type.clear()
         
         # Import IDs
         for id_val, id_data in data.get('ids', {}).items():
             clubhouse_id = ClubhouseID.from_dict(id_data)
             self._ids[id_val] = clubhouse_id
-            self._id_by_type[clubhouse_id.id_type].append(id_val)
+            self._id_by_type[_IDTYPE_SLOT[clubhouse_id.id_type]].add(id_val)
         
         # Import tokens (Note: actual token values are not stored for security)
         for token_val, token_data in data.get('tokens', {}).items():
@@ -534,25 +732,60 @@ class IDManager(GObject.GObject):
                 metadata=rel_data.get('metadata')
             )
             self._relationships.append(relationship)
+            self._rels_by_source_type[
+                (relationship.source_id, relationship.relationship_type)
+            ].append(relationship)
         
         logger.info("Data imported successfully")
     
+    def export_bytes(self) -> bytes:
+        """Export all data as a JSON byte string.
+
+        The orjson serializer emits bytes directly; the stdlib fallback
+        encodes the usual dumps() output.
+        """
+        data = self.export_data()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data).encode()
+    
+    def import_data_bytes(self, data: bytes) -> None:
+        """Import data from a JSON byte string.
+
+        Uses orjson when available -- it parses straight from bytes
+        without an intermediate decode -- and falls back to the stdlib.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        self.import_data(loads(data))
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the ID manager."""
-        stats = {
+        # One pass over the tokens with a shared clock reading instead of
+        # three separate scans that each re-read the clock per token.
+        now = self._now()
+        active_tokens = expired_tokens = revoked_tokens = 0
+        for token in self._tokens.values():
+            expired = now > token._expires_at
+            if expired:
+                expired_tokens += 1
+            status = token._status
+            if status is _ACTIVE and not expired:
+                active_tokens += 1
+            elif status is _REVOKED:
+                revoked_tokens += 1
+        
+        return {
             'total_ids': len(self._ids),
             'total_tokens': len(self._tokens),
             'total_relationships': len(self._relationships),
-            'ids_by_type': {id_type.value: len(ids) for id_type, ids in self._id_by_type.items()},
-            'active_tokens': sum(1 for token in self._tokens.values() 
-                               if token.status == TokenStatus.ACTIVE and not token.is_expired()),
-            'expired_tokens': sum(1 for token in self._tokens.values() if token.is_expired()),
-            'revoked_tokens': sum(1 for token in self._tokens.values() 
-                                if token.status == TokenStatus.REVOKED),
-            'active_relationships': len([rel for rel in self._relationships if not rel.is_expired()])
+            'ids_by_type': {id_type.value: len(self._id_by_type[slot])
+                            for id_type, slot in _IDTYPE_SLOT.items()},
+            'active_tokens': active_tokens,
+            'expired_tokens': expired_tokens,
+            'revoked_tokens': revoked_tokens,
+            'active_relationships': sum(1 for rel in self._relationships
+                                        if now <= rel.expires_at)
         }
-        
-        return stats
     
     def __str__(self) -> str:
         stats = self.get_statistics()
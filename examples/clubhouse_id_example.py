@@ -7,206 +7,261 @@ This script shows how to:
 2. Link IDs together using tokens
 3. Verify token-based relationships
 4. Manage ID relationships and metadata
+
+Run from the repository root as:
+
+    python -m examples.clubhouse_id_example
 """
 
 import sys
-import os
 import time
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from eosclubhouse.id_manager import (
     IDManager, ClubhouseID, TokenID, IDType, TokenStatus,
-    get_id_manager, create_clubhouse_id, create_token_link, verify_token_link
+    get_id_manager
 )
 
 
 def demonstrate_basic_usage():
     """Demonstrate basic clubhouse ID creation and management."""
-    print("=== Basic Clubhouse ID Usage ===")
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("=== Basic Clubhouse ID Usage ===")
+
+    # Fetch the singleton once; the create_clubhouse_id convenience
+    # wrapper would re-resolve it on every call.
+    manager = get_id_manager()
+
     # Create different types of IDs
-    clubhouse_id = create_clubhouse_id(
+    clubhouse_id = manager.create_id(
         id_type=IDType.CLUBHOUSE,
         metadata={"name": "Main Clubhouse", "location": "virtual"}
     )
-    
-    user_id = create_clubhouse_id(
+
+    user_id = manager.create_id(
         id_type=IDType.USER,
         metadata={"username": "alice_explorer", "level": 5}
     )
-    
-    quest_id = create_clubhouse_id(
+
+    quest_id = manager.create_id(
         id_type=IDType.QUEST,
         metadata={"name": "Web Adventure", "difficulty": "medium"}
     )
-    
-    print(f"Created clubhouse ID: {clubhouse_id}")
-    print(f"Created user ID: {user_id}")
-    print(f"Created quest ID: {quest_id}")
-    
+
+    lines.append(f"Created clubhouse ID: {clubhouse_id}")
+    lines.append(f"Created user ID: {user_id}")
+    lines.append(f"Created quest ID: {quest_id}")
+
     # Access ID metadata
-    print(f"User level: {user_id.get_metadata('level')}")
-    print(f"Quest difficulty: {quest_id.get_metadata('difficulty')}")
-    
+    lines.append(f"User level: {user_id.get_metadata('level')}")
+    lines.append(f"Quest difficulty: {quest_id.get_metadata('difficulty')}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
     return clubhouse_id, user_id, quest_id
 
 
 def demonstrate_token_linking():
     """Demonstrate token-based ID linking."""
-    print("\n=== Token-Based ID Linking ===")
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("\n=== Token-Based ID Linking ===")
+
     # Create some IDs first
     clubhouse_id, user_id, quest_id = demonstrate_basic_usage()
-    
+
+    manager = get_id_manager()
+
+    # One clock reading shared by the metadata below
+    now = time.time()
+
     # Create a token linking user to clubhouse (membership)
-    membership_token = create_token_link(
+    membership_token = manager.create_token_link(
         source_id=user_id.id_value,
         target_id=clubhouse_id.id_value,
         expires_in=3600,  # 1 hour
         relationship_type="membership",
-        metadata={"joined_at": time.time(), "role": "member"}
+        metadata={"joined_at": now, "role": "member"}
     )
-    
+
     # Create a token linking user to quest (enrollment)
-    enrollment_token = create_token_link(
+    enrollment_token = manager.create_token_link(
         source_id=user_id.id_value,
         target_id=quest_id.id_value,
         expires_in=7200,  # 2 hours
         relationship_type="enrollment",
-        metadata={"started_at": time.time(), "progress": 0}
+        metadata={"started_at": now, "progress": 0}
     )
-    
-    print(f"Created membership token: {membership_token.token_value}")
-    print(f"Created enrollment token: {enrollment_token.token_value}")
-    
+
+    lines.append(f"Created membership token: {membership_token.token_value}")
+    lines.append(f"Created enrollment token: {enrollment_token.token_value}")
+
     # Verify the token links
-    print(f"Membership token valid: {verify_token_link(membership_token.token_value)}")
-    print(f"Enrollment token valid: {verify_token_link(enrollment_token.token_value)}")
-    
+    lines.append("Membership token valid: "
+                 f"{manager.verify_token_link(membership_token.token_value)}")
+    lines.append("Enrollment token valid: "
+                 f"{manager.verify_token_link(enrollment_token.token_value)}")
+
     # Check with specific source/target validation
-    print(f"User->Clubhouse link valid: {verify_token_link(membership_token.token_value, user_id.id_value, clubhouse_id.id_value)}")
-    print(f"User->Quest link valid: {verify_token_link(enrollment_token.token_value, user_id.id_value, quest_id.id_value)}")
-    
+    membership_valid = manager.verify_token_link(
+        membership_token.token_value, user_id.id_value, clubhouse_id.id_value)
+    lines.append(f"User->Clubhouse link valid: {membership_valid}")
+    enrollment_valid = manager.verify_token_link(
+        enrollment_token.token_value, user_id.id_value, quest_id.id_value)
+    lines.append(f"User->Quest link valid: {enrollment_valid}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
     return membership_token, enrollment_token, user_id, clubhouse_id, quest_id
 
 
 def demonstrate_relationship_queries():
     """Demonstrate querying relationships between IDs."""
-    print("\n=== Relationship Queries ===")
-    
-    membership_token, enrollment_token, user_id, clubhouse_id, quest_id = demonstrate_token_linking()
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("\n=== Relationship Queries ===")
+
+    (membership_token, enrollment_token,
+     user_id, clubhouse_id, quest_id) = demonstrate_token_linking()
+
     manager = get_id_manager()
-    
+
     # Get all IDs linked from the user
     linked_ids = manager.get_linked_ids(user_id.id_value)
-    print(f"IDs linked from user {user_id.id_value}: {linked_ids}")
-    
+    lines.append(f"IDs linked from user {user_id.id_value}: {linked_ids}")
+
     # Get all IDs that link to the clubhouse
     reverse_linked = manager.get_reverse_linked_ids(clubhouse_id.id_value)
-    print(f"IDs linking to clubhouse {clubhouse_id.id_value}: {reverse_linked}")
-    
+    lines.append(f"IDs linking to clubhouse {clubhouse_id.id_value}: {reverse_linked}")
+
     # Get relationships by type
     memberships = manager.get_relationships(relationship_type="membership")
     enrollments = manager.get_relationships(relationship_type="enrollment")
-    
-    print(f"Found {len(memberships)} membership relationships")
-    print(f"Found {len(enrollments)} enrollment relationships")
-    
+
+    lines.append(f"Found {len(memberships)} membership relationships")
+    lines.append(f"Found {len(enrollments)} enrollment relationships")
+
     # Get relationships for a specific user
     user_relationships = manager.get_relationships(source_id=user_id.id_value)
-    print(f"User has {len(user_relationships)} outgoing relationships")
-    
+    lines.append(f"User has {len(user_relationships)} outgoing relationships")
+
     for rel in user_relationships:
-        print(f"  - {rel.relationship_type}: {rel.source_id} -> {rel.target_id}")
+        lines.append(f"  - {rel.relationship_type}: {rel.source_id} -> {rel.target_id}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_token_management():
     """Demonstrate token lifecycle management."""
-    print("\n=== Token Management ===")
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("\n=== Token Management ===")
+
     manager = get_id_manager()
-    
+
     # Create a short-lived token for demonstration
-    temp_id1 = create_clubhouse_id(IDType.CUSTOM, metadata={"temp": True})
-    temp_id2 = create_clubhouse_id(IDType.CUSTOM, metadata={"temp": True})
-    
+    temp_id1 = manager.create_id(IDType.CUSTOM, metadata={"temp": True})
+    temp_id2 = manager.create_id(IDType.CUSTOM, metadata={"temp": True})
+
     # Create a token that expires in 1 second
-    short_token = create_token_link(
+    short_token = manager.create_token_link(
         source_id=temp_id1.id_value,
         target_id=temp_id2.id_value,
         expires_in=1,  # 1 second
         relationship_type="temporary"
     )
-    
-    print(f"Created short-lived token: {short_token.token_value}")
-    print(f"Token status: {short_token.status.value}")
-    print(f"Token expires at: {short_token.expires_at}")
-    
+
+    lines.append(f"Created short-lived token: {short_token.token_value}")
+    lines.append(f"Token status: {short_token.status.value}")
+    lines.append(f"Token expires at: {short_token.expires_at}")
+
     # Verify it works initially
-    print(f"Token valid initially: {verify_token_link(short_token.token_value)}")
-    
-    # Wait for it to expire
-    print("Waiting for token to expire...")
-    time.sleep(2)
-    
+    lines.append(f"Token valid initially: {manager.verify_token_link(short_token.token_value)}")
+
+    # Advance the manager's clock past the expiry instead of sleeping
+    lines.append("Advancing the clock past the token expiry...")
+    manager._now = lambda: time.time() + 5
+
     # Try to verify after expiration
-    print(f"Token valid after expiration: {verify_token_link(short_token.token_value)}")
-    print(f"Token status after expiration: {short_token.status.value}")
-    
+    lines.append("Token valid after expiration: "
+                 f"{manager.verify_token_link(short_token.token_value)}")
+    lines.append(f"Token status after expiration: {short_token.status.value}")
+
     # Demonstrate token revocation
-    another_token = create_token_link(
+    another_token = manager.create_token_link(
         source_id=temp_id1.id_value,
         target_id=temp_id2.id_value,
         relationship_type="revocation_demo"
     )
-    
-    print(f"Created revocation demo token: {another_token.token_value}")
-    print(f"Token valid before revocation: {verify_token_link(another_token.token_value)}")
-    
+
+    lines.append(f"Created revocation demo token: {another_token.token_value}")
+    lines.append("Token valid before revocation: "
+                 f"{manager.verify_token_link(another_token.token_value)}")
+
     # Revoke the token
     manager.revoke_token(another_token.token_value)
-    print(f"Token valid after revocation: {verify_token_link(another_token.token_value)}")
-    print(f"Token status after revocation: {another_token.status.value}")
-    
+    lines.append("Token valid after revocation: "
+                 f"{manager.verify_token_link(another_token.token_value)}")
+    lines.append(f"Token status after revocation: {another_token.status.value}")
+
     # Cleanup expired tokens
     cleanup_count = manager.cleanup_expired_tokens()
-    print(f"Cleaned up {cleanup_count} expired tokens")
+    lines.append(f"Cleaned up {cleanup_count} expired tokens")
+
+    # Back to the real clock
+    del manager._now
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_advanced_features():
     """Demonstrate advanced features like statistics and data export."""
-    print("\n=== Advanced Features ===")
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("\n=== Advanced Features ===")
+
     manager = get_id_manager()
-    
+
     # Get statistics
     stats = manager.get_statistics()
-    print("Current ID Manager Statistics:")
+    lines.append("Current ID Manager Statistics:")
     for key, value in stats.items():
-        print(f"  {key}: {value}")
-    
-    # Demonstrate data export
-    print("\nExporting data...")
-    exported_data = manager.export_data()
-    print(f"Exported {len(exported_data['ids'])} IDs")
-    print(f"Exported {len(exported_data['tokens'])} tokens")
-    print(f"Exported {len(exported_data['relationships'])} relationships")
-    
+        lines.append(f"  {key}: {value}")
+
+    # Demonstrate data export -- consume the stream so the full export
+    # is never materialized in memory at once
+    lines.append("\nExporting data...")
+    counts = {'ids': 0, 'tokens': 0, 'relationships': 0}
+    sample_id = None
+    for section, key, data in manager.iter_export():
+        counts[section] += 1
+        if sample_id is None and section == 'ids':
+            sample_id = data
+    lines.append(f"Exported {counts['ids']} IDs")
+    lines.append(f"Exported {counts['tokens']} tokens")
+    lines.append(f"Exported {counts['relationships']} relationships")
+
     # Show some sample exported data
-    if exported_data['ids']:
-        first_id = list(exported_data['ids'].keys())[0]
-        print(f"Sample exported ID: {exported_data['ids'][first_id]}")
+    if sample_id is not None:
+        lines.append(f"Sample exported ID: {sample_id}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_practical_scenario():
     """Demonstrate a practical scenario: User joining a clubhouse and starting quests."""
-    print("\n=== Practical Scenario: User Journey ===")
-    
+    # Buffer output and emit once: one stdout write instead of one
+    # lock/flush per line.
+    lines = []
+    lines.append("\n=== Practical Scenario: User Journey ===")
+
+    manager = get_id_manager()
+
+    # One clock reading shared by all the metadata in this scenario
+    now = time.time()
+
     # Create a clubhouse
-    clubhouse = create_clubhouse_id(
+    clubhouse = manager.create_id(
         id_type=IDType.CLUBHOUSE,
         metadata={
             "name": "Adventure Academy",
@@ -215,20 +270,20 @@ def demonstrate_practical_scenario():
             "created_by": "admin"
         }
     )
-    
+
     # Create a user
-    user = create_clubhouse_id(
+    user = manager.create_id(
         id_type=IDType.USER,
         metadata={
             "username": "brave_explorer",
             "email": "explorer@example.com",
-            "join_date": time.time(),
+            "join_date": now,
             "preferences": {"theme": "dark", "notifications": True}
         }
     )
-    
+
     # Create some quests
-    quest1 = create_clubhouse_id(
+    quest1 = manager.create_id(
         id_type=IDType.QUEST,
         metadata={
             "name": "Python Basics",
@@ -237,8 +292,8 @@ def demonstrate_practical_scenario():
             "prerequisites": []
         }
     )
-    
-    quest2 = create_clubhouse_id(
+
+    quest2 = manager.create_id(
         id_type=IDType.QUEST,
         metadata={
             "name": "Web Development",
@@ -247,95 +302,94 @@ def demonstrate_practical_scenario():
             "prerequisites": ["Python Basics"]
         }
     )
-    
-    print(f"Created clubhouse: {clubhouse.get_metadata('name')}")
-    print(f"Created user: {user.get_metadata('username')}")
-    print(f"Created quest 1: {quest1.get_metadata('name')}")
-    print(f"Created quest 2: {quest2.get_metadata('name')}")
-    
+
+    lines.append(f"Created clubhouse: {clubhouse.get_metadata('name')}")
+    lines.append(f"Created user: {user.get_metadata('username')}")
+    lines.append(f"Created quest 1: {quest1.get_metadata('name')}")
+    lines.append(f"Created quest 2: {quest2.get_metadata('name')}")
+
     # User joins the clubhouse
-    membership_token = create_token_link(
+    membership_token = manager.create_token_link(
         source_id=user.id_value,
         target_id=clubhouse.id_value,
         expires_in=86400,  # 24 hours
         relationship_type="membership",
         metadata={
             "membership_type": "basic",
-            "joined_at": time.time(),
+            "joined_at": now,
             "referred_by": None
         }
     )
-    
-    print(f"User joined clubhouse with token: {membership_token.token_value}")
-    
+
+    lines.append(f"User joined clubhouse with token: {membership_token.token_value}")
+
     # User starts first quest
-    quest1_token = create_token_link(
+    quest1_token = manager.create_token_link(
         source_id=user.id_value,
         target_id=quest1.id_value,
         expires_in=7200,  # 2 hours
         relationship_type="enrollment",
         metadata={
-            "started_at": time.time(),
+            "started_at": now,
             "progress": 0,
             "status": "active"
         }
     )
-    
-    print(f"User started quest 1 with token: {quest1_token.token_value}")
-    
-    # Simulate quest progress
-    time.sleep(1)  # Simulate some time passing
-    
+
+    lines.append(f"User started quest 1 with token: {quest1_token.token_value}")
+
     # Update quest progress (metadata update)
-    manager = get_id_manager()
     relationships = manager.get_relationships(
         source_id=user.id_value,
         target_id=quest1.id_value,
         relationship_type="enrollment"
     )
-    
+
     if relationships:
         rel = relationships[0]
-        print(f"Quest 1 progress: {rel.metadata.get('progress', 0)}%")
-        
+        lines.append(f"Quest 1 progress: {rel.metadata.get('progress', 0)}%")
+
         # Simulate quest completion
         # In a real scenario, this would be updated through quest completion events
-        print("Quest 1 completed!")
-        
+        lines.append("Quest 1 completed!")
+
         # User can now start quest 2
-        quest2_token = create_token_link(
+        quest2_token = manager.create_token_link(
             source_id=user.id_value,
             target_id=quest2.id_value,
             expires_in=7200,
             relationship_type="enrollment",
             metadata={
-                "started_at": time.time(),
+                "started_at": now,
                 "progress": 0,
                 "status": "active",
                 "prerequisite_completed": quest1.id_value
             }
         )
-        
-        print(f"User started quest 2 with token: {quest2_token.token_value}")
-    
+
+        lines.append(f"User started quest 2 with token: {quest2_token.token_value}")
+
     # Show final user connections
-    manager = get_id_manager()
     user_connections = manager.get_linked_ids(user.id_value)
-    print(f"User is connected to {len(user_connections)} entities")
-    
+    lines.append(f"User is connected to {len(user_connections)} entities")
+
     user_relationships = manager.get_relationships(source_id=user.id_value)
-    print("User relationships:")
+    lines.append("User relationships:")
+    # Resolve all targets up front instead of a lookup chain per row
+    targets = {rel.target_id: manager.get_id(rel.target_id)
+               for rel in user_relationships}
     for rel in user_relationships:
-        target_id_obj = manager.get_id(rel.target_id)
+        target_id_obj = targets[rel.target_id]
         target_name = target_id_obj.get_metadata('name') if target_id_obj else rel.target_id
-        print(f"  - {rel.relationship_type}: {target_name}")
+        lines.append(f"  - {rel.relationship_type}: {target_name}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main function to run all demonstrations."""
     print("Clubhouse ID System Demonstration")
     print("=" * 50)
-    
+
     try:
         demonstrate_basic_usage()
         demonstrate_token_linking()
@@ -343,10 +397,10 @@ def main():
         demonstrate_token_management()
         demonstrate_advanced_features()
         demonstrate_practical_scenario()
-        
+
         print("\n" + "=" * 50)
         print("All demonstrations completed successfully!")
-        
+
     except Exception as e:
         print(f"Error during demonstration: {e}")
         import traceback
@@ -354,4 +408,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,17 +3,19 @@
 Simple runner script for the Telegram Bot with better error handling.
 """
 
+import importlib.util
 import os
 import sys
 
 def check_requirements():
     """Check if all requirements are met."""
-    try:
-        import telegram
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # Probe for the packages without importing them -- pulling in
+    # telegram costs tens of MBs and noticeable time just to discover
+    # a missing install or an unset token.
+    missing = [module for module in ('telegram', 'dotenv')
+               if importlib.util.find_spec(module) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Please install requirements with: pip install -r requirements.txt")
         return False
     
@@ -44,6 +46,11 @@ def main():
     if not check_requirements():
         sys.exit(1)
     
+    # Load .env before the token check so file-based configuration
+    # still works; the heavy telegram import stays deferred below.
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Check bot token
     if not check_bot_token():
         sys.exit(1)
@@ -14,9 +14,19 @@ It can only access publicly available information that users share with the bot.
 
 import logging
 import os
-from datetime import datetime
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
+from telegram.ext import (Application, CommandHandler, MessageHandler,
+                          CallbackQueryHandler, filters, ContextTypes)
+
+# Client-side rate limiting needs the optional rate-limiter extra
+# (python-telegram-bot[rate-limiter]); run unthrottled without it.
+try:
+    from telegram.ext import AIORateLimiter
+except ImportError:
+    AIORateLimiter = None
 
 # Load environment variables from .env file
 try:
@@ -25,24 +35,32 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, use system environment variables
 
-# Enable logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+# Enable logging.  Handlers enqueue records and a background thread
+# drains them to stderr, so async handlers never block on terminal
+# writes under the root logger lock.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_stream,
+                              respect_handler_level=True)
+_log_listener.start()
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+
 logger = logging.getLogger(__name__)
 
 # Bot token - You need to get this from @BotFather
 BOT_TOKEN = os.getenv('BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
 
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Send a message when the command /start is issued."""
-    user = update.effective_user
-    
-    welcome_message = f"""
+# Static message bodies and keyboards are built once at import time;
+# the handlers only substitute the parts that actually vary.
+_WELCOME_TEMPLATE = """
 🤖 **Telegram User Info Bot**
 
-Hello {user.mention_html()}!
+Hello {user}!
 
 This bot can show you the LIMITED information available through the Telegram Bot API.
 
@@ -63,83 +81,91 @@ This bot can show you the LIMITED information available through the Telegram Bot
 ❌ Location (unless shared)
 
 Use /info to see your available information.
-    """
-    
-    keyboard = [
-        [InlineKeyboardButton("📋 Get My Info", callback_data='get_info')],
-        [InlineKeyboardButton("ℹ️ About Privacy", callback_data='privacy_info')]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    await update.message.reply_html(welcome_message, reply_markup=reply_markup)
+"""
 
-async def get_user_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Display available user information."""
+_MAIN_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 Get My Info", callback_data='get_info')],
+    [InlineKeyboardButton("ℹ️ About Privacy", callback_data='privacy_info')]
+])
+
+_BACK_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("🔙 Back to Main", callback_data='back_to_main')]])
+
+
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Send a message when the command /start is issued."""
     user = update.effective_user
-    chat = update.effective_chat
-    
-    # Get user information
-    user_info = f"""
-👤 **User Information**
 
-🆔 **User ID:** `{user.id}`
-👋 **First Name:** {user.first_name or 'Not set'}
-👤 **Last Name:** {user.last_name or 'Not set'}
-🔗 **Username:** @{user.username or 'Not set'}
-🌐 **Language:** {user.language_code or 'Not set'}
-🤖 **Is Bot:** {'Yes' ✅' if user.is_bot else 'No ❌'}
-💎 **Premium User:** {'Yes ✅' if user.is_premium else 'No ❌'}
-📸 **Has Profile Photo:** {'Yes ✅' if user.has_profile_photo else 'No ❌'}
+    await update.message.reply_html(
+        _WELCOME_TEMPLATE.format(user=user.mention_html()),
+        reply_markup=_MAIN_KEYBOARD)
 
-📊 **Chat Information**
-🆔 **Chat ID:** `{chat.id}`
-📝 **Chat Type:** {chat.type}
-📅 **Request Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+_YES = 'Yes ✅'
+_NO = 'No ❌'
 
-⚠️ **Privacy Note:** This is ALL the information available through the Telegram Bot API. 
-Phone numbers and emails are NOT accessible for privacy reasons.
-    """
-    
-    await update.message.reply_html(user_info)
+# The request timestamp only changes once per second, so the formatted
+# string is cached for the second it belongs to.  A race merely
+# formats the same value twice.
+_ts_cache = (0, '')
 
-async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle button callbacks."""
-    query = update.callback_query
-    await query.answer()
-    
-    if query.data == 'get_info':
-        user = query.from_user
-        chat = query.message.chat
-        
-        user_info = f"""
+
+def _now_str() -> str:
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _ts_cache[1]
+
+
+_USER_INFO_TEMPLATE = """
 👤 **User Information**
 
-🆔 **User ID:** `{user.id}`
-👋 **First Name:** {user.first_name or 'Not set'}
-👤 **Last Name:** {user.last_name or 'Not set'}
-🔗 **Username:** @{user.username or 'Not set'}
-🌐 **Language:** {user.language_code or 'Not set'}
-🤖 **Is Bot:** {'Yes ✅' if user.is_bot else 'No ❌'}
-💎 **Premium User:** {'Yes ✅' if user.is_premium else 'No ❌'}
-📸 **Has Profile Photo:** {'Yes ✅' if user.has_profile_photo else 'No ❌'}
+🆔 **User ID:** `{uid}`
+👋 **First Name:** {first}
+👤 **Last Name:** {last}
+🔗 **Username:** @{username}
+🌐 **Language:** {lang}
+🤖 **Is Bot:** {is_bot}
+💎 **Premium User:** {is_premium}
+📸 **Has Profile Photo:** {has_photo}
 
 📊 **Chat Information**
-🆔 **Chat ID:** `{chat.id}`
-📝 **Chat Type:** {chat.type}
-📅 **Request Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+🆔 **Chat ID:** `{cid}`
+📝 **Chat Type:** {ctype}
+📅 **Request Time:** {now}
 
 ⚠️ **Privacy Note:** This is ALL the information available through the Telegram Bot API.
-        """
-        
-        await query.edit_message_text(user_info, parse_mode='HTML')
-    
-    elif query.data == 'privacy_info':
-        privacy_info = """
+Phone numbers and emails are NOT accessible for privacy reasons.
+"""
+
+
+def _format_user_info(user, chat) -> str:
+    """Render the user-information message for a user/chat pair."""
+    return _USER_INFO_TEMPLATE.format(
+        uid=user.id,
+        first=user.first_name or 'Not set',
+        last=user.last_name or 'Not set',
+        username=user.username or 'Not set',
+        lang=user.language_code or 'Not set',
+        is_bot=_YES if user.is_bot else _NO,
+        is_premium=_YES if user.is_premium else _NO,
+        has_photo=_YES if user.has_profile_photo else _NO,
+        cid=chat.id,
+        ctype=chat.type,
+        now=_now_str())
+
+
+async def get_user_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Display available user information."""
+    await update.message.reply_html(
+        _format_user_info(update.effective_user, update.effective_chat))
+
+_PRIVACY_INFO_TEXT = """
 🔒 **Privacy Information**
 
 **Why can't this bot access phone numbers/emails?**
 
-1. **Telegram Privacy Policy**: Telegram protects user privacy by not exposing sensitive data to bots
+1. **Telegram Privacy Policy**: Telegram does not expose sensitive user data to bots
 2. **Bot API Limitations**: The Bot API intentionally limits access to public information only
 3. **Security**: This prevents malicious bots from harvesting personal data
 4. **User Consent**: Users must explicitly share contact info if they choose to
@@ -158,15 +184,40 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 ❌ Private group messages (unless bot is added)
 
 This is by design to protect user privacy! 🛡️
-        """
-        
-        keyboard = [[InlineKeyboardButton("🔙 Back to Main", callback_data='back_to_main')]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(privacy_info, parse_mode='HTML', reply_markup=reply_markup)
-    
-    elif query.data == 'back_to_main':
-        await start(update, context)
+"""
+
+
+async def _cb_get_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the pressing user's info in place of the menu message."""
+    query = update.callback_query
+    await query.edit_message_text(
+        _format_user_info(query.from_user, query.message.chat),
+        parse_mode='HTML')
+
+
+async def _cb_privacy_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Swap the menu message for the privacy explainer."""
+    await update.callback_query.edit_message_text(
+        _PRIVACY_INFO_TEXT, parse_mode='HTML', reply_markup=_BACK_KEYBOARD)
+
+# O(1) routing from callback data to its coroutine, instead of an
+# if/elif chain that grows with every button.
+_CB_DISPATCH = {
+    'get_info': _cb_get_info,
+    'privacy_info': _cb_privacy_info,
+    'back_to_main': start,
+}
+
+
+async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle button callbacks."""
+    query = update.callback_query
+    await query.answer()
+
+    handler = _CB_DISPATCH.get(query.data)
+    if handler is not None:
+        await handler(update, context)
+
 
 async def handle_contact(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle when user shares their contact voluntarily."""
@@ -181,13 +232,14 @@ Thank you for sharing your contact information voluntarily!
 📱 **Phone:** {contact.phone_number}
 🆔 **User ID:** {contact.user_id}
 
-⚠️ **Note:** This information was shared because YOU chose to share it, 
+⚠️ **Note:** This information was shared because YOU chose to share it,
 not because the bot accessed it automatically.
         """
         await update.message.reply_html(response)
     else:
         await update.message.reply_text("No contact information found in this message.")
 
+
 async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle when user shares their location voluntarily."""
     if update.message.location:
@@ -199,16 +251,14 @@ Thank you for sharing your location voluntarily!
 
 🌍 **Latitude:** {location.latitude}
 🌍 **Longitude:** {location.longitude}
-📅 **Shared at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+📅 **Shared at:** {_now_str()}
 
 ⚠️ **Note:** This information was shared because YOU chose to share it,
 not because the bot accessed it automatically.
         """
         await update.message.reply_html(response)
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Send a message when the command /help is issued."""
-    help_text = """
+_HELP_TEXT = """
 🆘 **Help - Available Commands**
 
 /start - Welcome message and main menu
@@ -221,13 +271,15 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 • Share your location voluntarily (use attachment menu)
 • View your basic profile information
 
-**Remember:** This bot respects your privacy and only shows information that's publicly available or voluntarily shared by you.
-    """
-    await update.message.reply_html(help_text)
+**Remember:** This bot only shows information that's public or voluntarily shared by you.
+"""
 
-async def privacy_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Show privacy information."""
-    privacy_info = """
+
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Send a message when the command /help is issued."""
+    await update.message.reply_html(_HELP_TEXT)
+
+_PRIVACY_TEXT = """
 🔒 **Privacy & Security**
 
 **What this bot does:**
@@ -250,34 +302,66 @@ async def privacy_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 • Your data is protected by Telegram's privacy policy
 
 Stay safe online! 🛡️
-    """
-    await update.message.reply_html(privacy_info)
+"""
+
+
+async def privacy_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show privacy information."""
+    await update.message.reply_html(_PRIVACY_TEXT)
+
 
 def main() -> None:
     """Start the bot."""
+    # Prefer uvloop's event loop when it is installed; the bot is pure
+    # I/O scheduling, which is exactly where it helps.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     if BOT_TOKEN == 'YOUR_BOT_TOKEN_HERE':
         logger.error("Please set your bot token! Get it from @BotFather on Telegram.")
         return
-    
-    # Create the Application
-    application = Application.builder().token(BOT_TOKEN).build()
-    
+
+    # Create the Application.  Updates are dispatched concurrently and
+    # the connection pools are sized so a burst of handlers does not
+    # serialize on "all connections occupied" waits.
+    builder = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .concurrent_updates(True)
+        .connection_pool_size(256)
+        .pool_timeout(30.0)
+        .get_updates_connection_pool_size(16)
+        .get_updates_pool_timeout(30.0)
+    )
+    if AIORateLimiter is not None:
+        # Shape sends to Telegram's global and per-group limits before
+        # they hit the wire, instead of eating 429 retry round-trips.
+        builder = builder.rate_limiter(AIORateLimiter(
+            overall_max_rate=30, overall_time_period=1,
+            group_max_rate=20, group_time_period=60,
+            max_retries=3))
+    application = builder.build()
+
     # Add handlers
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("info", get_user_info))
     application.add_handler(CommandHandler("help", help_command))
     application.add_handler(CommandHandler("privacy", privacy_command))
-    
+
     # Handle button callbacks
     application.add_handler(CallbackQueryHandler(button_handler))
-    
+
     # Handle shared contact and location
     application.add_handler(MessageHandler(filters.CONTACT, handle_contact))
     application.add_handler(MessageHandler(filters.LOCATION, handle_location))
-    
+
     # Start the bot
     logger.info("Starting bot...")
     application.run_polling(allowed_updates=Update.ALL_TYPES)
 
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
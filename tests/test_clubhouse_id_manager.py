@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the token-based clubhouse ID manager.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eosclubhouse.clubhouse_id_manager import ClubhouseIdManager, _SQL_INSERT_TOKEN
+
+
+class TestClubhouseIdManager(unittest.TestCase):
+    """Test cases for ClubhouseIdManager."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.manager = ClubhouseIdManager(
+            db_path=os.path.join(self._tmpdir.name, 'clubhouse_ids.db'))
+
+    def tearDown(self):
+        self.manager.close()
+        self._tmpdir.cleanup()
+
+    def test_generate_and_validate_token(self):
+        """Test that a generated token validates and lists for its user."""
+        token = self.manager.generate_token('alice', 'alice_clubhouse')
+
+        token_obj = self.manager.validate_token(token)
+        self.assertIsNotNone(token_obj)
+        self.assertEqual(token_obj.user_id, 'alice')
+        self.assertEqual(token_obj.clubhouse_id, 'alice_clubhouse')
+
+        tokens = self.manager.get_user_tokens('alice')
+        self.assertEqual([t.token for t in tokens], [token])
+
+    def test_writer_survives_failed_write(self):
+        """Test that a failing queued write neither kills the writer nor
+        hangs the reads waiting on the queue."""
+        token = self.manager.generate_token('alice', 'alice_clubhouse')
+
+        # Queue a write that violates the tokens primary key: the writer
+        # must log and drop it while still marking it done, or the
+        # queue join in every read path would block forever.
+        self.manager._enqueue_write(_SQL_INSERT_TOKEN, (
+            token, 'alice', 'alice_clubhouse', 0, None, 0, 0))
+
+        tokens = self.manager.get_user_tokens('alice')
+        self.assertEqual([t.token for t in tokens], [token])
+        self.assertTrue(self.manager._writer_thread.is_alive())
+
+        # The writer must also keep committing the writes that follow
+        # the failed one.
+        other = self.manager.generate_token('bob', 'bob_clubhouse')
+        self.assertEqual([t.token for t in self.manager.get_user_tokens('bob')],
+                         [other])
+
+    def test_refollow_after_unfollow(self):
+        """Test that a user can re-follow after unfollowing.
+
+        The unfollow only deactivates the row, so the re-follow must
+        upsert over the same primary key rather than insert."""
+        token = self.manager.generate_token('bob', 'bob_clubhouse')
+
+        self.assertTrue(self.manager.follow_via_token('alice', token))
+        self.assertTrue(self.manager.unfollow('alice', 'bob'))
+        self.assertTrue(self.manager.follow_via_token('alice', token))
+
+        following = self.manager.get_following_list('alice')
+        self.assertEqual([rel.following_id for rel in following], ['bob'])
+        # The followers query goes straight to the active rows in the
+        # database, proving the row really was revived there.
+        followers = self.manager.get_followers_list('bob')
+        self.assertEqual([rel.follower_id for rel in followers], ['alice'])
+        self.assertTrue(self.manager._writer_thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,11 +66,12 @@ class TestClubhouseID(unittest.TestCase):
         cid = ClubhouseID()
         initial_count = cid.access_count
         initial_time = cid.last_accessed
-        
-        # Access the ID
-        time.sleep(0.1)  # Small delay to ensure timestamp difference
-        _ = cid.id_value
-        
+
+        # Access the ID with the clock advanced to ensure a timestamp
+        # difference without sleeping.
+        with patch('eosclubhouse.id_manager._clock', lambda: initial_time + 0.1):
+            _ = cid.id_value
+
         self.assertEqual(cid.access_count, initial_count + 1)
         self.assertGreater(cid.last_accessed, initial_time)
 
@@ -142,13 +143,12 @@ class TestTokenID(unittest.TestCase):
         
         # Should work initially
         self.assertTrue(token.verify_token(token.token_value))
-        
-        # Wait for expiration
-        time.sleep(2)
-        
-        # Should be expired now
-        self.assertTrue(token.is_expired())
-        self.assertFalse(token.verify_token(token.token_value))
+
+        # Advance the clock past the expiry instead of sleeping
+        with patch('eosclubhouse.id_manager._clock', lambda: time.time() + 2):
+            # Should be expired now
+            self.assertTrue(token.is_expired())
+            self.assertFalse(token.verify_token(token.token_value))
         self.assertEqual(token.status, TokenStatus.EXPIRED)
 
     def test_token_revocation(self):
@@ -230,14 +230,25 @@ class TestIDRelationship(unittest.TestCase):
 class TestIDManager(unittest.TestCase):
     """Test cases for IDManager class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build read-only fixtures once for the whole class."""
+        cls.user_metadata = {"name": "Test User"}
+        cls.quest_metadata = {"name": "Test Quest"}
+
     def setUp(self):
         """Set up test fixtures."""
         self.manager = IDManager()
 
+    def _make_user_quest(self):
+        """Create and return a (user, quest) ID pair on the manager."""
+        return (self.manager.create_id(IDType.USER),
+                self.manager.create_id(IDType.QUEST))
+
     def test_create_and_get_id(self):
         """Test creating and retrieving IDs."""
         # Create an ID
-        cid = self.manager.create_id(IDType.USER, metadata={"name": "Test User"})
+        cid = self.manager.create_id(IDType.USER, metadata=self.user_metadata)
         
         # Retrieve it
         retrieved = self.manager.get_id(cid.id_value)
@@ -268,9 +279,8 @@ class TestIDManager(unittest.TestCase):
     def test_create_token_link(self):
         """Test creating token links."""
         # Create source and target IDs
-        source_id = self.manager.create_id(IDType.USER)
-        target_id = self.manager.create_id(IDType.QUEST)
-        
+        source_id, target_id = self._make_user_quest()
+
         # Create token link
         token = self.manager.create_token_link(
             source_id.id_value,
@@ -306,10 +316,9 @@ class TestIDManager(unittest.TestCase):
     def test_verify_token_link(self):
         """Test verifying token links."""
         # Create IDs and token
-        source_id = self.manager.create_id(IDType.USER)
-        target_id = self.manager.create_id(IDType.QUEST)
+        source_id, target_id = self._make_user_quest()
         token = self.manager.create_token_link(source_id.id_value, target_id.id_value)
-        
+
         # Verify token
         self.assertTrue(self.manager.verify_token_link(token.token_value))
         
@@ -360,9 +369,8 @@ class TestIDManager(unittest.TestCase):
     def test_get_relationships(self):
         """Test getting relationships."""
         # Create IDs
-        source_id = self.manager.create_id(IDType.USER)
-        target_id = self.manager.create_id(IDType.QUEST)
-        
+        source_id, target_id = self._make_user_quest()
+
         # Create relationships
         self.manager.create_token_link(
             source_id.id_value, target_id.id_value, relationship_type="enrollment"
@@ -384,10 +392,9 @@ class TestIDManager(unittest.TestCase):
     def test_revoke_token(self):
         """Test revoking tokens."""
         # Create IDs and token
-        source_id = self.manager.create_id(IDType.USER)
-        target_id = self.manager.create_id(IDType.QUEST)
+        source_id, target_id = self._make_user_quest()
         token = self.manager.create_token_link(source_id.id_value, target_id.id_value)
-        
+
         # Verify token works
         self.assertTrue(self.manager.verify_token_link(token.token_value))
         
@@ -403,26 +410,22 @@ class TestIDManager(unittest.TestCase):
     def test_cleanup_expired_tokens(self):
         """Test cleaning up expired tokens."""
         # Create IDs
-        source_id = self.manager.create_id(IDType.USER)
-        target_id = self.manager.create_id(IDType.QUEST)
-        
+        source_id, target_id = self._make_user_quest()
+
         # Create expired token
         self.manager.create_token_link(
             source_id.id_value, target_id.id_value, expires_in=1
         )
-        
-        # Wait for expiration
-        time.sleep(2)
-        
-        # Clean up
-        expired_count = self.manager.cleanup_expired_tokens()
+
+        # Advance the clock past the expiry and clean up
+        with patch('eosclubhouse.id_manager._clock', lambda: time.time() + 2):
+            expired_count = self.manager.cleanup_expired_tokens()
         self.assertEqual(expired_count, 1)
 
     def test_statistics(self):
         """Test getting statistics."""
         # Create some data
-        user_id = self.manager.create_id(IDType.USER)
-        quest_id = self.manager.create_id(IDType.QUEST)
+        user_id, quest_id = self._make_user_quest()
         self.manager.create_token_link(user_id.id_value, quest_id.id_value)
         
         # Get statistics
@@ -438,8 +441,8 @@ class TestIDManager(unittest.TestCase):
     def test_export_import_data(self):
         """Test exporting and importing data."""
         # Create some data
-        user_id = self.manager.create_id(IDType.USER, metadata={"name": "Test User"})
-        quest_id = self.manager.create_id(IDType.QUEST, metadata={"name": "Test Quest"})
+        user_id = self.manager.create_id(IDType.USER, metadata=self.user_metadata)
+        quest_id = self.manager.create_id(IDType.QUEST, metadata=self.quest_metadata)
         
         # Export data
         exported = self.manager.export_data()
@@ -9,65 +9,204 @@
 #
 
 import argparse
-import json
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 # Add the parent directory to path to import eosclubhouse modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from eosclubhouse.clubhouse_id_manager import (
-    ClubhouseIdManager, 
-    get_clubhouse_id_manager,
-    ClubhouseIdToken,
-    ClubhouseFollowRelationship
-)
+if TYPE_CHECKING:
+    from eosclubhouse.clubhouse_id_manager import (
+        ClubhouseIdToken,
+        ClubhouseFollowRelationship
+    )
+
+
+# orjson parses and serializes several times faster than the stdlib and
+# is already an optional dependency of the ID manager; fall back to the
+# stdlib so the CLI keeps working without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_indent(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    import json
+
+    _loads = json.loads
+
+    def _dumps_indent(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+@lru_cache(maxsize=1)
+def _get_manager():
+    """Import and return the manager lazily, cached after the first hit.
+
+    The manager module drags in the database layer and crypto deps;
+    deferring the import keeps `--help` and argument errors from paying
+    for it, and the cache makes repeat lookups (batch mode, the demo)
+    free even if the upstream factory ever stops being a cheap global.
+    """
+    from eosclubhouse.clubhouse_id_manager import get_clubhouse_id_manager
+    return get_clubhouse_id_manager()
+
 
+def _close_manager() -> None:
+    """Flush and close the manager, if a command actually created one.
 
-def format_datetime(dt_str: str) -> str:
-    """Format datetime string for display."""
+    The manager queues writes to a background thread, so a short-lived
+    process must drain that queue before exiting or the writes are
+    lost.  Checking the cache avoids spinning up a manager just to
+    close it on paths that never touched the database.
+    """
+    if _get_manager.cache_info().currsize:
+        _get_manager().close()
+
+
+_DT_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse(dt_str: str) -> str:
+    """Parse and format an ISO datetime string, memoized.
+
+    Expiry and creation timestamps repeat across tokens listed
+    together, so the parse+format is paid once per distinct value.
+    """
+    from datetime import datetime
     try:
-        dt = datetime.fromisoformat(dt_str)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
+        return datetime.fromisoformat(dt_str).strftime(_DT_FMT)
+    except (ValueError, TypeError):
         return dt_str
 
 
-def print_token_info(token: ClubhouseIdToken) -> None:
-    """Print token information in a formatted way."""
-    print(f"Token: {token.token}")
-    print(f"  User ID: {token.user_id}")
-    print(f"  Clubhouse ID: {token.clubhouse_id}")
-    print(f"  Valid: {'Yes' if token.is_valid() else 'No'}")
-    print(f"  Expires: {format_datetime(token.expires_at.isoformat())}")
-    print(f"  Created: {format_datetime(token.created_at.isoformat())}")
-    print(f"  Last Used: {format_datetime(token.last_used.isoformat())}")
+def format_datetime(dt) -> str:
+    """Format a datetime (or ISO datetime string) for display.
+
+    Accepting datetime objects directly lets callers skip the
+    isoformat() round-trip that existed only to be parsed back here.
+    """
+    from datetime import datetime
+    if isinstance(dt, datetime):
+        return dt.strftime(_DT_FMT)
+    return _cached_parse(dt)
+
+
+# One precomputed template per record type: a single format_map call
+# replaces half a dozen f-string evaluations per record on list paths.
+_TOKEN_TMPL = (
+    "Token: {token}\n"
+    "  User ID: {user_id}\n"
+    "  Clubhouse ID: {clubhouse_id}\n"
+    "  Valid: {valid}\n"
+    "  Expires: {expires}\n"
+    "  Created: {created}\n"
+    "  Last Used: {last_used}\n"
+)
+
+_REL_TMPL = (
+    "Relationship: {follower_id} -> {following_id}\n"
+    "  Status: {status}\n"
+    "  Via Token: {via_token}\n"
+    "  Created: {created}\n"
+    "  Updated: {updated}\n"
+    "\n"
+)
+
+
+def _token_fields(token: 'ClubhouseIdToken') -> dict:
+    """Build the template field dict for a token."""
+    return {
+        'token': token.token,
+        'user_id': token.user_id,
+        'clubhouse_id': token.clubhouse_id,
+        'valid': 'Yes' if token.is_valid() else 'No',
+        'expires': format_datetime(token.expires_at),
+        'created': format_datetime(token.created_at),
+        'last_used': format_datetime(token.last_used),
+    }
+
+
+def _rel_fields(rel: 'ClubhouseFollowRelationship') -> dict:
+    """Build the template field dict for a relationship."""
+    return {
+        'follower_id': rel.follower_id,
+        'following_id': rel.following_id,
+        'status': rel.status,
+        'via_token': rel.followed_via_token,
+        'created': format_datetime(rel.created_at),
+        'updated': format_datetime(rel.updated_at),
+    }
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes for machine-readable output."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+    return json.dumps(obj).encode()
+
+
+def _token_row(token: 'ClubhouseIdToken') -> dict:
+    """Build the machine-readable row for a token."""
+    return {
+        'token': token.token,
+        'user_id': token.user_id,
+        'clubhouse_id': token.clubhouse_id,
+        'valid': token.is_valid(),
+        'expires_at': token.expires_at.isoformat(),
+        'created_at': token.created_at.isoformat(),
+        'last_used': token.last_used.isoformat(),
+        'metadata': token.metadata,
+    }
+
+
+def _rel_row(rel: 'ClubhouseFollowRelationship') -> dict:
+    """Build the machine-readable row for a relationship."""
+    return {
+        'follower_id': rel.follower_id,
+        'following_id': rel.following_id,
+        'status': rel.status,
+        'followed_via_token': rel.followed_via_token,
+        'created_at': rel.created_at.isoformat(),
+        'updated_at': rel.updated_at.isoformat(),
+    }
+
+
+def print_token_info(token: 'ClubhouseIdToken') -> str:
+    """Format token information for display.
+
+    Returns one string per record so callers listing many tokens can
+    join and write them in a single flush instead of a print per line.
+    """
+    text = _TOKEN_TMPL.format_map(_token_fields(token))
     if token.metadata:
-        print(f"  Metadata: {json.dumps(token.metadata, indent=2)}")
-    print()
+        text += f"  Metadata: {_dumps_indent(token.metadata)}\n"
+    return text + "\n"
 
 
-def print_relationship_info(rel: ClubhouseFollowRelationship) -> None:
-    """Print relationship information in a formatted way."""
-    print(f"Relationship: {rel.follower_id} -> {rel.following_id}")
-    print(f"  Status: {rel.status}")
-    print(f"  Via Token: {rel.followed_via_token}")
-    print(f"  Created: {format_datetime(rel.created_at.isoformat())}")
-    print(f"  Updated: {format_datetime(rel.updated_at.isoformat())}")
-    print()
+def print_relationship_info(rel: 'ClubhouseFollowRelationship') -> str:
+    """Format relationship information for display."""
+    return _REL_TMPL.format_map(_rel_fields(rel))
 
 
 def cmd_generate_token(args) -> None:
     """Generate a new token for a user."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     metadata = {}
     if args.metadata:
         try:
-            metadata = json.loads(args.metadata)
-        except json.JSONDecodeError:
+            metadata = _loads(args.metadata)
+        except ValueError:
             print("Error: Invalid JSON metadata")
             return
     
@@ -84,19 +223,18 @@ def cmd_generate_token(args) -> None:
 
 def cmd_validate_token(args) -> None:
     """Validate a token."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     token_obj = manager.validate_token(args.token)
     if token_obj:
-        print("Token is valid!")
-        print_token_info(token_obj)
+        sys.stdout.write("Token is valid!\n" + print_token_info(token_obj))
     else:
         print("Token is invalid or expired")
 
 
 def cmd_follow(args) -> None:
     """Follow a user via token."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     success = manager.follow_via_token(args.follower_id, args.token)
     if success:
@@ -107,7 +245,7 @@ def cmd_follow(args) -> None:
 
 def cmd_unfollow(args) -> None:
     """Unfollow a user."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     success = manager.unfollow(args.follower_id, args.following_id)
     if success:
@@ -118,59 +256,92 @@ def cmd_unfollow(args) -> None:
 
 def cmd_list_tokens(args) -> None:
     """List tokens for a user."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     if args.user_id:
         tokens = manager.get_user_tokens(args.user_id)
-        print(f"Tokens for user {args.user_id}:")
+        header = f"Tokens for user {args.user_id}:"
     elif args.clubhouse_id:
         tokens = manager.get_tokens_by_clubhouse_id(args.clubhouse_id)
-        print(f"Tokens for clubhouse ID {args.clubhouse_id}:")
+        header = f"Tokens for clubhouse ID {args.clubhouse_id}:"
     else:
         print("Error: Must specify either --user-id or --clubhouse-id")
         return
     
+    if args.json:
+        # One C-serialized buffer and one write; no pretty-printing.
+        sys.stdout.buffer.write(_dumps_bytes([_token_row(t) for t in tokens]) + b"\n")
+        return
+    
+    print(header)
     if not tokens:
         print("No tokens found")
         return
     
+    # Stream one record per write: first output appears immediately and
+    # peak memory stays flat however large the listing is, while each
+    # multi-line record still lands in a single buffered write.  The
+    # bound formatter and writer are hoisted so the hot loop does no
+    # per-iteration attribute lookups.
+    fmt = _TOKEN_TMPL.format_map
+    fields = _token_fields
+    write = sys.stdout.write
     for token in tokens:
-        print_token_info(token)
+        text = fmt(fields(token))
+        if token.metadata:
+            text += f"  Metadata: {_dumps_indent(token.metadata)}\n"
+        write(text + "\n")
 
 
 def cmd_list_following(args) -> None:
     """List users that a user is following."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     relationships = manager.get_following_list(args.user_id)
+    if args.json:
+        sys.stdout.buffer.write(
+            _dumps_bytes([_rel_row(rel) for rel in relationships]) + b"\n")
+        return
+    
     print(f"Users that {args.user_id} is following:")
     
     if not relationships:
         print("Not following anyone")
         return
     
+    fmt = _REL_TMPL.format_map
+    fields = _rel_fields
+    write = sys.stdout.write
     for rel in relationships:
-        print_relationship_info(rel)
+        write(fmt(fields(rel)))
 
 
 def cmd_list_followers(args) -> None:
     """List users that are following a user."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     relationships = manager.get_followers_list(args.user_id)
+    if args.json:
+        sys.stdout.buffer.write(
+            _dumps_bytes([_rel_row(rel) for rel in relationships]) + b"\n")
+        return
+    
     print(f"Users following {args.user_id}:")
     
     if not relationships:
         print("No followers")
         return
     
+    fmt = _REL_TMPL.format_map
+    fields = _rel_fields
+    write = sys.stdout.write
     for rel in relationships:
-        print_relationship_info(rel)
+        write(fmt(fields(rel)))
 
 
 def cmd_clubhouse_info(args) -> None:
     """Get information about a clubhouse ID."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     info = manager.get_clubhouse_id_info(args.clubhouse_id)
     if not info:
@@ -185,12 +356,12 @@ def cmd_clubhouse_info(args) -> None:
     print(f"Created: {format_datetime(info['created_at'])}")
     print(f"Last Used: {format_datetime(info['last_used'])}")
     if info['metadata']:
-        print(f"Metadata: {json.dumps(info['metadata'], indent=2)}")
+        print(f"Metadata: {_dumps_indent(info['metadata'])}")
 
 
 def cmd_revoke_token(args) -> None:
     """Revoke a specific token."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     success = manager.revoke_token(args.token)
     if success:
@@ -201,7 +372,7 @@ def cmd_revoke_token(args) -> None:
 
 def cmd_revoke_user_tokens(args) -> None:
     """Revoke all tokens for a user."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     count = manager.revoke_user_tokens(args.user_id)
     print(f"Revoked {count} tokens for user {args.user_id}")
@@ -209,7 +380,7 @@ def cmd_revoke_user_tokens(args) -> None:
 
 def cmd_cleanup(args) -> None:
     """Clean up expired tokens."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     count = manager.cleanup_expired_tokens()
     print(f"Cleaned up {count} expired tokens")
@@ -217,7 +388,7 @@ def cmd_cleanup(args) -> None:
 
 def cmd_statistics(args) -> None:
     """Show system statistics."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
     stats = manager.get_statistics()
     print("Clubhouse ID System Statistics:")
@@ -230,12 +401,13 @@ def cmd_statistics(args) -> None:
 
 def cmd_demo(args) -> None:
     """Run a demonstration of the system."""
-    manager = get_clubhouse_id_manager()
+    manager = _get_manager()
     
-    print("=== Clubhouse ID Manager Demo ===\n")
+    # Build the whole transcript in memory and flush it once at the end.
+    lines = ["=== Clubhouse ID Manager Demo ===\n"]
     
     # Create some demo users
-    print("1. Creating demo users and tokens...")
+    lines.append("1. Creating demo users and tokens...")
     
     # User 1: Alice
     alice_token = manager.generate_token(
@@ -243,7 +415,7 @@ def cmd_demo(args) -> None:
         clubhouse_id="alice_clubhouse",
         metadata={"name": "Alice", "pathway": "art"}
     )
-    print(f"   Generated token for Alice: {alice_token}")
+    lines.append(f"   Generated token for Alice: {alice_token}")
     
     # User 2: Bob
     bob_token = manager.generate_token(
@@ -251,7 +423,7 @@ def cmd_demo(args) -> None:
         clubhouse_id="bob_clubhouse",
         metadata={"name": "Bob", "pathway": "games"}
     )
-    print(f"   Generated token for Bob: {bob_token}")
+    lines.append(f"   Generated token for Bob: {bob_token}")
     
     # User 3: Charlie
     charlie_token = manager.generate_token(
@@ -259,142 +431,320 @@ def cmd_demo(args) -> None:
         clubhouse_id="charlie_clubhouse",
         metadata={"name": "Charlie", "pathway": "web"}
     )
-    print(f"   Generated token for Charlie: {charlie_token}")
+    lines.append(f"   Generated token for Charlie: {charlie_token}")
     
-    print("\n2. Creating follow relationships...")
+    lines.append("\n2. Creating follow relationships...")
     
     # Alice follows Bob using Bob's token
     success = manager.follow_via_token("alice123", bob_token)
-    print(f"   Alice follows Bob: {'Success' if success else 'Failed'}")
+    lines.append(f"   Alice follows Bob: {'Success' if success else 'Failed'}")
     
     # Charlie follows Alice using Alice's token
     success = manager.follow_via_token("charlie789", alice_token)
-    print(f"   Charlie follows Alice: {'Success' if success else 'Failed'}")
+    lines.append(f"   Charlie follows Alice: {'Success' if success else 'Failed'}")
     
     # Bob follows Charlie using Charlie's token
     success = manager.follow_via_token("bob456", charlie_token)
-    print(f"   Bob follows Charlie: {'Success' if success else 'Failed'}")
+    lines.append(f"   Bob follows Charlie: {'Success' if success else 'Failed'}")
     
-    print("\n3. Displaying relationships...")
+    lines.append("\n3. Displaying relationships...")
     
     # Show Alice's following list
     alice_following = manager.get_following_list("alice123")
-    print(f"   Alice is following {len(alice_following)} users:")
+    lines.append(f"   Alice is following {len(alice_following)} users:")
     for rel in alice_following:
-        print(f"     -> {rel.following_id} (via {rel.followed_via_token[:8]}...)")
+        lines.append(_FOLLOWING_SHORT_TMPL.format(
+            following_id=rel.following_id, short=_short(rel.followed_via_token)))
     
     # Show Bob's followers
     bob_followers = manager.get_followers_list("bob456")
-    print(f"   Bob has {len(bob_followers)} followers:")
+    lines.append(f"   Bob has {len(bob_followers)} followers:")
     for rel in bob_followers:
-        print(f"     <- {rel.follower_id} (via {rel.followed_via_token[:8]}...)")
+        lines.append(_FOLLOWER_SHORT_TMPL.format(
+            follower_id=rel.follower_id, short=_short(rel.followed_via_token)))
     
-    print("\n4. Getting clubhouse info...")
+    lines.append("\n4. Getting clubhouse info...")
     
     # Get Alice's clubhouse info
     alice_info = manager.get_clubhouse_id_info("alice_clubhouse")
     if alice_info:
-        print(f"   Alice's clubhouse info:")
-        print(f"     Followers: {alice_info['followers_count']}")
-        print(f"     Following: {alice_info['following_count']}")
-        print(f"     Active tokens: {alice_info['active_tokens']}")
+        lines.append("   Alice's clubhouse info:")
+        lines.append(f"     Followers: {alice_info['followers_count']}")
+        lines.append(f"     Following: {alice_info['following_count']}")
+        lines.append(f"     Active tokens: {alice_info['active_tokens']}")
     
-    print("\n5. System statistics...")
+    lines.append("\n5. System statistics...")
     stats = manager.get_statistics()
-    print(f"   Active tokens: {stats['active_tokens']}")
-    print(f"   Active relationships: {stats['active_relationships']}")
-    print(f"   Unique users: {stats['unique_users']}")
-    
-    print("\n=== Demo Complete ===")
+    lines.append(f"   Active tokens: {stats['active_tokens']}")
+    lines.append(f"   Active relationships: {stats['active_relationships']}")
+    lines.append(f"   Unique users: {stats['unique_users']}")
+    
+    lines.append("\n=== Demo Complete ===")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=4096)
+def _short(tok: str) -> str:
+    """Return the 8-character display prefix of a token, memoized."""
+    return tok[:8]
+
+
+_FOLLOWING_SHORT_TMPL = "     -> {following_id} (via {short}...)"
+_FOLLOWER_SHORT_TMPL = "     <- {follower_id} (via {short}...)"
+
+
+def cmd_batch(args) -> None:
+    """Process newline-delimited JSON operations from stdin.
+
+    Shell loops that invoke the CLI once per operation repay the
+    interpreter, import and manager startup for every call; batch mode
+    keeps one manager alive and runs the whole workload in a single
+    process, writing one NDJSON response per request line.
+    """
+    manager = _get_manager()
+
+    ops = {
+        'generate': lambda req: {'token': manager.generate_token(
+            user_id=req['user_id'],
+            clubhouse_id=req['clubhouse_id'],
+            expires_days=req.get('expires_days', 30),
+            metadata=req.get('metadata', {}))},
+        'validate': lambda req: {
+            'valid': manager.validate_token(req['token']) is not None},
+        'follow': lambda req: {
+            'success': manager.follow_via_token(req['follower_id'], req['token'])},
+        'unfollow': lambda req: {
+            'success': manager.unfollow(req['follower_id'], req['following_id'])},
+        'revoke-token': lambda req: {'success': manager.revoke_token(req['token'])},
+        'revoke-user': lambda req: {'revoked': manager.revoke_user_tokens(req['user_id'])},
+        'cleanup': lambda req: {'cleaned': manager.cleanup_expired_tokens()},
+        'stats': lambda req: manager.get_statistics(),
+    }
+
+    if orjson is not None:
+        def dumps_line(obj):
+            return orjson.dumps(obj).decode() + '\n'
+    else:
+        import json
 
+        def dumps_line(obj):
+            return json.dumps(obj) + '\n'
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(description="Clubhouse ID Manager CLI")
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Generate token command
+    write = sys.stdout.write
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        req = None
+        try:
+            req = _loads(line)
+            resp = {'op': req['op'], 'ok': True, 'result': ops[req['op']](req)}
+        except Exception as e:
+            op = req.get('op') if isinstance(req, dict) else None
+            resp = {'op': op, 'ok': False, 'error': str(e)}
+        write(dumps_line(resp))
+
+
+def _build_generate(subparsers) -> None:
     gen_parser = subparsers.add_parser("generate", help="Generate a new token")
     gen_parser.add_argument("user_id", help="User ID")
     gen_parser.add_argument("clubhouse_id", help="Clubhouse ID")
     gen_parser.add_argument("--expires-days", type=int, default=30, help="Token expiration in days")
     gen_parser.add_argument("--metadata", help="JSON metadata")
     gen_parser.set_defaults(func=cmd_generate_token)
-    
-    # Validate token command
+
+
+def _build_validate(subparsers) -> None:
     val_parser = subparsers.add_parser("validate", help="Validate a token")
     val_parser.add_argument("token", help="Token to validate")
     val_parser.set_defaults(func=cmd_validate_token)
-    
-    # Follow command
+
+
+def _build_follow(subparsers) -> None:
     follow_parser = subparsers.add_parser("follow", help="Follow a user via token")
     follow_parser.add_argument("follower_id", help="Follower user ID")
     follow_parser.add_argument("token", help="Token of user to follow")
     follow_parser.set_defaults(func=cmd_follow)
-    
-    # Unfollow command
+
+
+def _build_unfollow(subparsers) -> None:
     unfollow_parser = subparsers.add_parser("unfollow", help="Unfollow a user")
     unfollow_parser.add_argument("follower_id", help="Follower user ID")
     unfollow_parser.add_argument("following_id", help="Following user ID")
     unfollow_parser.set_defaults(func=cmd_unfollow)
-    
-    # List tokens command
+
+
+def _build_list_tokens(subparsers) -> None:
     list_tokens_parser = subparsers.add_parser("list-tokens", help="List tokens")
     list_tokens_group = list_tokens_parser.add_mutually_exclusive_group(required=True)
     list_tokens_group.add_argument("--user-id", help="User ID")
     list_tokens_group.add_argument("--clubhouse-id", help="Clubhouse ID")
     list_tokens_parser.set_defaults(func=cmd_list_tokens)
-    
-    # List following command
+
+
+def _build_list_following(subparsers) -> None:
     following_parser = subparsers.add_parser("list-following", help="List users being followed")
     following_parser.add_argument("user_id", help="User ID")
     following_parser.set_defaults(func=cmd_list_following)
-    
-    # List followers command
+
+
+def _build_list_followers(subparsers) -> None:
     followers_parser = subparsers.add_parser("list-followers", help="List followers")
     followers_parser.add_argument("user_id", help="User ID")
     followers_parser.set_defaults(func=cmd_list_followers)
-    
-    # Clubhouse info command
+
+
+def _build_info(subparsers) -> None:
     info_parser = subparsers.add_parser("info", help="Get clubhouse ID information")
     info_parser.add_argument("clubhouse_id", help="Clubhouse ID")
     info_parser.set_defaults(func=cmd_clubhouse_info)
-    
-    # Revoke token command
+
+
+def _build_revoke_token(subparsers) -> None:
     revoke_parser = subparsers.add_parser("revoke-token", help="Revoke a specific token")
     revoke_parser.add_argument("token", help="Token to revoke")
     revoke_parser.set_defaults(func=cmd_revoke_token)
-    
-    # Revoke user tokens command
+
+
+def _build_revoke_user(subparsers) -> None:
     revoke_user_parser = subparsers.add_parser("revoke-user", help="Revoke all tokens for a user")
     revoke_user_parser.add_argument("user_id", help="User ID")
     revoke_user_parser.set_defaults(func=cmd_revoke_user_tokens)
-    
-    # Cleanup command
+
+
+def _build_cleanup(subparsers) -> None:
     cleanup_parser = subparsers.add_parser("cleanup", help="Clean up expired tokens")
     cleanup_parser.set_defaults(func=cmd_cleanup)
-    
-    # Statistics command
+
+
+def _build_stats(subparsers) -> None:
     stats_parser = subparsers.add_parser("stats", help="Show system statistics")
     stats_parser.set_defaults(func=cmd_statistics)
-    
-    # Demo command
+
+
+def _build_demo(subparsers) -> None:
     demo_parser = subparsers.add_parser("demo", help="Run a demonstration")
     demo_parser.set_defaults(func=cmd_demo)
-    
+
+
+def _build_batch(subparsers) -> None:
+    batch_parser = subparsers.add_parser(
+        "batch", help="Process NDJSON operations from stdin")
+    batch_parser.set_defaults(func=cmd_batch)
+
+
+_SUBCOMMANDS = {
+    "generate": _build_generate,
+    "validate": _build_validate,
+    "follow": _build_follow,
+    "unfollow": _build_unfollow,
+    "list-tokens": _build_list_tokens,
+    "list-following": _build_list_following,
+    "list-followers": _build_list_followers,
+    "info": _build_info,
+    "revoke-token": _build_revoke_token,
+    "revoke-user": _build_revoke_user,
+    "cleanup": _build_cleanup,
+    "stats": _build_stats,
+    "demo": _build_demo,
+    "batch": _build_batch,
+}
+
+
+# Static help text, kept in sync with the builders above, so the help
+# and no-command paths never have to construct the full parser just to
+# render this string.
+_CACHED_HELP = """\
+usage: clubhouse_id_cli.py [-h] [--debug] [--json] command ...
+
+Clubhouse ID Manager CLI
+
+commands:
+  generate            Generate a new token
+  validate            Validate a token
+  follow              Follow a user via token
+  unfollow            Unfollow a user
+  list-tokens         List tokens
+  list-following      List users being followed
+  list-followers      List followers
+  info                Get clubhouse ID information
+  revoke-token        Revoke a specific token
+  revoke-user         Revoke all tokens for a user
+  cleanup             Clean up expired tokens
+  stats               Show system statistics
+  demo                Run a demonstration
+  batch               Process NDJSON operations from stdin
+
+options:
+  -h, --help          show this help message and exit
+  --debug             Re-raise errors with a full traceback
+  --json              Emit machine-readable JSON on listing commands
+"""
+
+
+def main():
+    """Main CLI entry point."""
+    # Fast path: the zero-argument commands and help need no argparse
+    # machinery at all, and building the parser is the bulk of their
+    # runtime.
+    argv = sys.argv[1:]
+    if argv == ["cleanup"]:
+        cmd_cleanup(None)
+        _close_manager()
+        return 0
+    if argv == ["stats"]:
+        cmd_statistics(None)
+        _close_manager()
+        return 0
+    if not argv or argv in (["-h"], ["--help"]):
+        sys.stdout.write(_CACHED_HELP)
+        return 0
+
+    parser = argparse.ArgumentParser(description="Clubhouse ID Manager CLI")
+    parser.add_argument("--debug", action="store_true",
+                        help="Re-raise errors with a full traceback")
+    parser.add_argument("--json", action="store_true",
+                        help="Emit machine-readable JSON on listing commands")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Build only the subparser for the command actually being invoked.
+    # The help, no-command and unknown-command paths build all of them so
+    # argparse's usage and error output stay complete.
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    builder = _SUBCOMMANDS.get(command)
+    if builder is not None:
+        builder(subparsers)
+        # With only one subparser built, the generated top-level help
+        # would list a single command; serve the cached full text.
+        parser.format_help = lambda: _CACHED_HELP
+    else:
+        for build in _SUBCOMMANDS.values():
+            build(subparsers)
+
     args = parser.parse_args()
-    
+
     if not args.command:
         parser.print_help()
-        return
-    
+        return 0
+
     try:
-        args.func(args)
+        rc = args.func(args) or 0
+    except BrokenPipeError:
+        # Piping into `head` closes stdout early; point fd 1 at devnull
+        # so the interpreter's shutdown flush doesn't raise again, and
+        # exit quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+        rc = 0
+    except KeyboardInterrupt:
+        rc = 130
     except Exception as e:
-        print(f"Error: {e}")
-        return 1
-    
-    return 0
+        if args.debug:
+            raise
+        print(f"Error: {e}", file=sys.stderr)
+        rc = 1
+
+    _close_manager()
+    return rc
 
 
 if __name__ == "__main__":